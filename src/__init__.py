@@ -0,0 +1 @@
+"""Quality Culture Barometer"""
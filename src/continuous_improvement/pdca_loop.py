@@ -4,9 +4,11 @@ PDCA integration with quality management systems
 """
 
 from typing import Dict, List, Optional
+import numbers
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import pandas as pd
+import numpy as np
 import json
 
 @dataclass
@@ -30,7 +32,7 @@ class PDCALoop:
     
     def __init__(self, organization_id: str):
         self.organization_id = organization_id
-        self.improvement_actions = []
+        self.improvement_actions: Dict[str, ImprovementAction] = {}  # Keyed by action id
         self.assessment_history = []
         self.benchmarks = {}
         
@@ -40,28 +42,29 @@ class PDCALoop:
         
         # Analyze assessment results
         low_scoring_areas = self._identify_low_scoring_areas(assessment_results)
+        to_improve = low_scoring_areas[low_scoring_areas < 70]  # Threshold for improvement
+        priorities = np.where(to_improve < 50, "High", "Medium")
         
-        for area, score in low_scoring_areas.items():
-            if score < 70:  # Threshold for improvement
-                action = ImprovementAction(
-                    id=f"IMP_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{len(actions)}",
-                    title=f"Improve {area}",
-                    description=f"Address low performance in {area} (score: {score:.1f})",
-                    priority="High" if score < 50 else "Medium",
-                    owner="Quality Manager",
-                    target_date=datetime.now() + timedelta(days=90),
-                    status="Planned",
-                    metrics={"target_score": 80, "current_score": score},
-                    dependencies=[]
-                )
-                actions.append(action)
+        for (area, score), priority in zip(to_improve.items(), priorities):
+            action = ImprovementAction(
+                id=f"IMP_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{len(self.improvement_actions) + len(actions)}",
+                title=f"Improve {area}",
+                description=f"Address low performance in {area} (score: {score:.1f})",
+                priority=str(priority),
+                owner="Quality Manager",
+                target_date=datetime.now() + timedelta(days=90),
+                status="Planned",
+                metrics={"target_score": 80, "current_score": float(score)},
+                dependencies=[]
+            )
+            actions.append(action)
         
-        self.improvement_actions.extend(actions)
+        self.improvement_actions.update((action.id, action) for action in actions)
         return actions
     
     def do_phase(self, action_id: str, progress_update: Dict):
         """Do phase - execute improvement actions"""
-        action = next((a for a in self.improvement_actions if a.id == action_id), None)
+        action = self.improvement_actions.get(action_id)
         if action:
             action.status = "In Progress"
             # Update progress metrics
@@ -71,7 +74,7 @@ class PDCALoop:
         """Check phase - measure improvement effectiveness"""
         results = {}
         
-        for action in self.improvement_actions:
+        for action in self.improvement_actions.values():
             if action.status == "In Progress":
                 area = action.title.replace("Improve ", "")
                 if area in reassessment_results:
@@ -92,22 +95,21 @@ class PDCALoop:
         standardizations = {}
         
         for action_id in successful_actions:
-            action = next((a for a in self.improvement_actions if a.id == action_id), None)
+            action = self.improvement_actions.get(action_id)
             if action and action.status == "Completed":
                 # Create standardization document
                 standardizations[action.title] = self._create_standardization(action)
         
         return standardizations
     
-    def _identify_low_scoring_areas(self, results: Dict) -> Dict[str, float]:
+    def _identify_low_scoring_areas(self, results: Dict) -> pd.Series:
         """Identify areas with low scores"""
-        low_scoring = {}
-        
-        for category, score in results.items():
-            if isinstance(score, (int, float)) and score < 80:
-                low_scoring[category] = score
-        
-        return low_scoring
+        # Only real numbers are scores; numeric strings and booleans are skipped
+        scores = pd.Series({
+            category: score for category, score in results.items()
+            if isinstance(score, numbers.Real) and not isinstance(score, bool)
+        }, dtype=float)
+        return scores[scores < 80]
     
     def _create_standardization(self, action: ImprovementAction) -> str:
         """Create standardization document for successful improvement"""
@@ -133,62 +135,72 @@ class PDCALoop:
     
     def generate_improvement_report(self) -> Dict:
         """Generate comprehensive improvement report"""
+        actions = self._actions_frame()
+        status_counts = actions["status"].value_counts()
+        
         report = {
             "organization_id": self.organization_id,
             "report_date": datetime.now().isoformat(),
-            "total_actions": len(self.improvement_actions),
-            "completed_actions": len([a for a in self.improvement_actions if a.status == "Completed"]),
-            "in_progress": len([a for a in self.improvement_actions if a.status == "In Progress"]),
-            "planned_actions": len([a for a in self.improvement_actions if a.status == "Planned"]),
-            "improvement_trends": self._calculate_improvement_trends(),
-            "recommendations": self._generate_recommendations()
+            "total_actions": len(actions),
+            "completed_actions": int(status_counts.get("Completed", 0)),
+            "in_progress": int(status_counts.get("In Progress", 0)),
+            "planned_actions": int(status_counts.get("Planned", 0)),
+            "improvement_trends": self._calculate_improvement_trends(actions),
+            "recommendations": self._generate_recommendations(actions)
         }
         
         return report
     
-    def _calculate_improvement_trends(self) -> Dict[str, float]:
+    def _actions_frame(self) -> pd.DataFrame:
+        """Columnar view of the improvement actions, one row per action"""
+        return pd.DataFrame.from_records(
+            [
+                (
+                    a.id,
+                    a.title.split()[1],  # Extract category from title
+                    a.status,
+                    a.priority,
+                    a.metrics.get('current_score', 0),
+                    a.metrics.get('final_score', 0),
+                    a.metrics.get('target_score', 80)
+                )
+                for a in self.improvement_actions.values()
+            ],
+            columns=["id", "category", "status", "priority",
+                     "current_score", "final_score", "target_score"]
+        )
+    
+    def _calculate_improvement_trends(self, actions: Optional[pd.DataFrame] = None) -> Dict[str, float]:
         """Calculate improvement trends over time"""
-        trends = {}
-        
-        # Group actions by category
-        categories = {}
-        for action in self.improvement_actions:
-            category = action.title.split()[1]  # Extract category from title
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(action)
+        if actions is None:
+            actions = self._actions_frame()
         
-        # Calculate average improvement per category
-        for category, actions in categories.items():
-            completed = [a for a in actions if a.status == "Completed"]
-            if completed:
-                avg_improvement = np.mean([
-                    a.metrics.get('final_score', 0) - a.metrics.get('current_score', 0)
-                    for a in completed
-                ])
-                trends[category] = avg_improvement
+        # Average improvement per category over completed actions
+        completed = actions[actions["status"] == "Completed"]
+        improvement = completed["final_score"] - completed["current_score"]
         
-        return trends
+        return improvement.groupby(completed["category"], sort=False).mean().to_dict()
     
-    def _generate_recommendations(self) -> List[str]:
+    def _generate_recommendations(self, actions: Optional[pd.DataFrame] = None) -> List[str]:
         """Generate strategic recommendations"""
+        if actions is None:
+            actions = self._actions_frame()
         recommendations = []
         
         # Analyze action completion rates
-        total = len(self.improvement_actions)
-        completed = len([a for a in self.improvement_actions if a.status == "Completed"])
+        total = len(actions)
         
         if total > 0:
-            completion_rate = completed / total
+            completion_rate = (actions["status"] == "Completed").mean()
             
             if completion_rate < 0.7:
                 recommendations.append("Improve action execution - consider resource allocation")
             
-            if len([a for a in self.improvement_actions if a.priority == "High"]) > 5:
+            if (actions["priority"] == "High").sum() > 5:
                 recommendations.append("Focus on high-priority improvements to maximize impact")
         
         # Analyze trends
-        trends = self._calculate_improvement_trends()
+        trends = self._calculate_improvement_trends(actions)
         low_improvement_areas = [k for k, v in trends.items() if v < 5]
         
         if low_improvement_areas:
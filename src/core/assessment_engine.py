@@ -5,9 +5,11 @@ Core assessment framework based on ISO 10010:2022 and international standards
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Tuple, Optional
 from dataclasses import dataclass
+from functools import cached_property
 from enum import Enum
+from types import MappingProxyType
 
 class AssessmentType(Enum):
     """Supported assessment frameworks"""
@@ -38,6 +40,287 @@ class AssessmentConfig:
     language: str = 'fr'
     include_external_stakeholders: bool = False
 
+class _FrozenDict(dict):
+    """
+    Read-only dict for the shared framework tables: mutators raise TypeError, while
+    json.dumps, copy and pickle still treat it as the plain dict it is
+    """
+    __slots__ = ()
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only")
+    
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+
+def _freeze(value):
+    """Read-only copy of a nested table: dicts become _FrozenDict, lists become tuples"""
+    if isinstance(value, dict):
+        return _FrozenDict({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+_EMPTY = _FrozenDict()
+
+# ISO 10010:2022 framework structure
+_ISO10010_FRAMEWORK = _freeze({
+    "dimensions": {
+        "leadership": {
+            "weight": 0.25,
+            "subthemes": ["vision_alignment", "commitment", "resource_allocation"]
+        },
+        "engagement": {
+            "weight": 0.20,
+            "subthemes": ["employee_involvement", "empowerment", "recognition"]
+        },
+        "process_approach": {
+            "weight": 0.20,
+            "subthemes": ["systematic_approach", "continuous_improvement", "evidence_based"]
+        },
+        "customer_focus": {
+            "weight": 0.15,
+            "subthemes": ["understanding_needs", "satisfaction_measurement", "relationship_management"]
+        },
+        "learning_development": {
+            "weight": 0.20,
+            "subthemes": ["knowledge_management", "competence_development", "innovation"]
+        }
+    },
+    "methodology": {
+        "steps": [
+            "understand_context",
+            "determine_desired_culture",
+            "assess_current_culture",
+            "identify_gaps",
+            "develop_action_plan",
+            "implement_changes",
+            "monitor_improvement"
+        ]
+    }
+})
+
+# AFNOR Quality Culture Barometer structure
+_AFNOR_FRAMEWORK = _freeze({
+    "dimensions": {
+        "responsibility": {"weight": 0.10},
+        "first_time_right": {"weight": 0.10},
+        "problem_reporting": {"weight": 0.10},
+        "continuous_improvement": {"weight": 0.10},
+        "customer_focus": {"weight": 0.10},
+        "leadership": {"weight": 0.10},
+        "engagement": {"weight": 0.10},
+        "training": {"weight": 0.10},
+        "communication": {"weight": 0.10},
+        "results_orientation": {"weight": 0.10}
+    },
+    "methodology": {
+        "double_perspective": True,  # Individual vs company view
+        "npqs_calculation": True,
+        "slider_scale": True
+    }
+})
+
+# PDA Quality Culture Assessment for pharmaceutical
+_PDA_FRAMEWORK = _freeze({
+    "dimensions": {
+        "leadership": {"maturity_elements": 5},
+        "communication": {"maturity_elements": 4},
+        "ownership": {"maturity_elements": 4},
+        "continuous_improvement": {"maturity_elements": 4},
+        "technical_excellence": {"maturity_elements": 4}
+    },
+    "methodology": {
+        "maturity_levels": 5,
+        "audit_combination": True,
+        "regulatory_compliance": True
+    }
+})
+
+# EFQM RADAR framework
+_EFQM_FRAMEWORK = _freeze({
+    "criteria": {
+        "leadership": {"weight": 0.10},
+        "strategy": {"weight": 0.08},
+        "people": {"weight": 0.09},
+        "partnerships": {"weight": 0.09},
+        "processes": {"weight": 0.14},
+        "customer_results": {"weight": 0.20},
+        "people_results": {"weight": 0.12},
+        "society_results": {"weight": 0.06},
+        "business_results": {"weight": 0.15}
+    },
+    "methodology": {
+        "radar_approach": True,
+        "scoring_matrix": True
+    }
+})
+
+# Baldrige Excellence Framework
+_BALDRIGE_FRAMEWORK = _freeze({
+    "criteria": {
+        "leadership": {"weight": 0.12},
+        "strategy": {"weight": 0.08},
+        "customers": {"weight": 0.12},
+        "measurement": {"weight": 0.09},
+        "workforce": {"weight": 0.12},
+        "operations": {"weight": 0.12},
+        "results": {"weight": 0.45}
+    },
+    "methodology": {
+        "scoring_guidelines": True,
+        "maturity_levels": True
+    }
+})
+
+# Generic items applicable across sectors
+_GENERIC_ITEMS = _freeze((
+    {
+        "id": "L1",
+        "dimension": "leadership",
+        "text": "La Direction communique clairement ses attentes qualité",
+        "type": "likert_5",
+        "mirror": True
+    },
+    {
+        "id": "B3",
+        "dimension": "behaviors",
+        "text": "Je signale immédiatement tout écart",
+        "type": "likert_5",
+        "mirror": True
+    },
+    {
+        "id": "P2",
+        "dimension": "process",
+        "text": "Les indicateurs qualité sont accessibles en temps réel",
+        "type": "likert_5",
+        "mirror": True
+    },
+))
+
+# Pharmaceutical sector specific items
+_PHARMA_ITEMS = _freeze((
+    {
+        "id": "PH1",
+        "dimension": "regulatory",
+        "text": "Les exigences réglementaires sont intégrées dans nos processus",
+        "type": "likert_5"
+    },
+    {
+        "id": "PH2",
+        "dimension": "validation",
+        "text": "Les validations sont réalisées selon les bonnes pratiques",
+        "type": "likert_5"
+    },
+))
+
+# Healthcare sector specific items
+_HEALTHCARE_ITEMS = _freeze((
+    {
+        "id": "HC1",
+        "dimension": "patient_safety",
+        "text": "La sécurité des patients est notre priorité absolue",
+        "type": "likert_5"
+    },
+))
+
+# Education sector specific items
+_EDUCATION_ITEMS = _freeze((
+    {
+        "id": "ED1",
+        "dimension": "student_focus",
+        "text": "La réussite des étudiants guide nos décisions",
+        "type": "likert_5"
+    },
+))
+
+# AFNOR NPQS scoring methodology
+_AFNOR_METHODOLOGY = _freeze({
+    "type": "npqs",
+    "calculation": "promoters - detractors",
+    "scale": "0-10",
+    "categories": {
+        "promoters": [9, 10],
+        "passives": [7, 8],
+        "detractors": [0, 1, 2, 3, 4, 5, 6]
+    }
+})
+
+# ISO 10010 maturity scoring
+_ISO10010_METHODOLOGY = _freeze({
+    "type": "maturity",
+    "levels": 5,
+    "scale": "1-5",
+    "descriptions": [
+        "Initial/Ad-hoc",
+        "Managed",
+        "Defined",
+        "Quantitatively Managed",
+        "Optimizing"
+    ]
+})
+
+# PDA maturity scoring
+_PDA_METHODOLOGY = _freeze({
+    "type": "maturity_matrix",
+    "levels": 5,
+    "dimensions": ["leadership", "communication", "ownership", "ci", "technical"],
+    "scoring": "0-100"
+})
+
+# EFQM RADAR scoring
+_EFQM_METHODOLOGY = _freeze({
+    "type": "radar",
+    "approach": {"weight": 0.25},
+    "deployment": {"weight": 0.25},
+    "assessment": {"weight": 0.25},
+    "refinement": {"weight": 0.25}
+})
+
+# Baldrige scoring
+_BALDRIGE_METHODOLOGY = _freeze({
+    "type": "maturity_levels",
+    "levels": 6,
+    "scale": "0-1000",
+    "approach": "ADLI",
+    "results": "LeTCI"
+})
+
+# Lookup tables shared by every assessment instead of being rebuilt per instance
+_FRAMEWORKS = MappingProxyType({
+    AssessmentType.ISO_10010: _ISO10010_FRAMEWORK,
+    AssessmentType.AFNOR: _AFNOR_FRAMEWORK,
+    AssessmentType.PDA: _PDA_FRAMEWORK,
+    AssessmentType.EFQM: _EFQM_FRAMEWORK,
+    AssessmentType.BALDRIGE: _BALDRIGE_FRAMEWORK
+})
+
+# This would load from JSON files in production
+_ITEMS_BANK = MappingProxyType({
+    "generic": _GENERIC_ITEMS,
+    "pharmaceutical": _PHARMA_ITEMS,
+    "healthcare": _HEALTHCARE_ITEMS,
+    "education": _EDUCATION_ITEMS
+})
+
+_METHODOLOGIES = MappingProxyType({
+    AssessmentType.AFNOR: _AFNOR_METHODOLOGY,
+    AssessmentType.ISO_10010: _ISO10010_METHODOLOGY,
+    AssessmentType.PDA: _PDA_METHODOLOGY,
+    AssessmentType.EFQM: _EFQM_METHODOLOGY,
+    AssessmentType.BALDRIGE: _BALDRIGE_METHODOLOGY
+})
+
+
 class QualityCultureAssessment:
     """
     Main assessment engine implementing ISO 10010:2022 methodology
@@ -51,208 +334,16 @@ class QualityCultureAssessment:
         
     def _load_framework(self) -> Dict:
         """Load the appropriate framework based on assessment type"""
-        frameworks = {
-            AssessmentType.ISO_10010: self._load_iso10010_framework(),
-            AssessmentType.AFNOR: self._load_afnor_framework(),
-            AssessmentType.PDA: self._load_pda_framework(),
-            AssessmentType.EFQM: self._load_efqm_framework(),
-            AssessmentType.BALDRIGE: self._load_baldrige_framework()
-        }
-        return frameworks.get(self.config.assessment_type, {})
-    
-    def _load_iso10010_framework(self) -> Dict:
-        """ISO 10010:2022 framework structure"""
-        return {
-            "dimensions": {
-                "leadership": {
-                    "weight": 0.25,
-                    "subthemes": ["vision_alignment", "commitment", "resource_allocation"]
-                },
-                "engagement": {
-                    "weight": 0.20,
-                    "subthemes": ["employee_involvement", "empowerment", "recognition"]
-                },
-                "process_approach": {
-                    "weight": 0.20,
-                    "subthemes": ["systematic_approach", "continuous_improvement", "evidence_based"]
-                },
-                "customer_focus": {
-                    "weight": 0.15,
-                    "subthemes": ["understanding_needs", "satisfaction_measurement", "relationship_management"]
-                },
-                "learning_development": {
-                    "weight": 0.20,
-                    "subthemes": ["knowledge_management", "competence_development", "innovation"]
-                }
-            },
-            "methodology": {
-                "steps": [
-                    "understand_context",
-                    "determine_desired_culture",
-                    "assess_current_culture",
-                    "identify_gaps",
-                    "develop_action_plan",
-                    "implement_changes",
-                    "monitor_improvement"
-                ]
-            }
-        }
-    
-    def _load_afnor_framework(self) -> Dict:
-        """AFNOR Quality Culture Barometer structure"""
-        return {
-            "dimensions": {
-                "responsibility": {"weight": 0.10},
-                "first_time_right": {"weight": 0.10},
-                "problem_reporting": {"weight": 0.10},
-                "continuous_improvement": {"weight": 0.10},
-                "customer_focus": {"weight": 0.10},
-                "leadership": {"weight": 0.10},
-                "engagement": {"weight": 0.10},
-                "training": {"weight": 0.10},
-                "communication": {"weight": 0.10},
-                "results_orientation": {"weight": 0.10}
-            },
-            "methodology": {
-                "double_perspective": True,  # Individual vs company view
-                "npqs_calculation": True,
-                "slider_scale": True
-            }
-        }
-    
-    def _load_pda_framework(self) -> Dict:
-        """PDA Quality Culture Assessment for pharmaceutical"""
-        return {
-            "dimensions": {
-                "leadership": {"maturity_elements": 5},
-                "communication": {"maturity_elements": 4},
-                "ownership": {"maturity_elements": 4},
-                "continuous_improvement": {"maturity_elements": 4},
-                "technical_excellence": {"maturity_elements": 4}
-            },
-            "methodology": {
-                "maturity_levels": 5,
-                "audit_combination": True,
-                "regulatory_compliance": True
-            }
-        }
-    
-    def _load_efqm_framework(self) -> Dict:
-        """EFQM RADAR framework"""
-        return {
-            "criteria": {
-                "leadership": {"weight": 0.10},
-                "strategy": {"weight": 0.08},
-                "people": {"weight": 0.09},
-                "partnerships": {"weight": 0.09},
-                "processes": {"weight": 0.14},
-                "customer_results": {"weight": 0.20},
-                "people_results": {"weight": 0.12},
-                "society_results": {"weight": 0.06},
-                "business_results": {"weight": 0.15}
-            },
-            "methodology": {
-                "radar_approach": True,
-                "scoring_matrix": True
-            }
-        }
-    
-    def _load_baldrige_framework(self) -> Dict:
-        """Baldrige Excellence Framework"""
-        return {
-            "criteria": {
-                "leadership": {"weight": 0.12},
-                "strategy": {"weight": 0.08},
-                "customers": {"weight": 0.12},
-                "measurement": {"weight": 0.09},
-                "workforce": {"weight": 0.12},
-                "operations": {"weight": 0.12},
-                "results": {"weight": 0.45}
-            },
-            "methodology": {
-                "scoring_guidelines": True,
-                "maturity_levels": True
-            }
-        }
+        # Shared read-only table, frozen down to the leaves at import
+        return _FRAMEWORKS.get(self.config.assessment_type, _EMPTY)
     
     def _load_items_bank(self) -> Dict:
         """Load the appropriate items bank based on sector and type"""
-        # This would load from JSON files in production
-        return {
-            "generic": self._load_generic_items(),
-            "pharmaceutical": self._load_pharma_items(),
-            "healthcare": self._load_healthcare_items(),
-            "education": self._load_education_items()
-        }
-    
-    def _load_generic_items(self) -> List[Dict]:
-        """Generic items applicable across sectors"""
-        return [
-            {
-                "id": "L1",
-                "dimension": "leadership",
-                "text": "La Direction communique clairement ses attentes qualité",
-                "type": "likert_5",
-                "mirror": True
-            },
-            {
-                "id": "B3",
-                "dimension": "behaviors",
-                "text": "Je signale immédiatement tout écart",
-                "type": "likert_5",
-                "mirror": True
-            },
-            {
-                "id": "P2",
-                "dimension": "process",
-                "text": "Les indicateurs qualité sont accessibles en temps réel",
-                "type": "likert_5",
-                "mirror": True
-            }
-        ]
-    
-    def _load_pharma_items(self) -> List[Dict]:
-        """Pharmaceutical sector specific items"""
-        return [
-            {
-                "id": "PH1",
-                "dimension": "regulatory",
-                "text": "Les exigences réglementaires sont intégrées dans nos processus",
-                "type": "likert_5"
-            },
-            {
-                "id": "PH2",
-                "dimension": "validation",
-                "text": "Les validations sont réalisées selon les bonnes pratiques",
-                "type": "likert_5"
-            }
-        ]
-    
-    def _load_healthcare_items(self) -> List[Dict]:
-        """Healthcare sector specific items"""
-        return [
-            {
-                "id": "HC1",
-                "dimension": "patient_safety",
-                "text": "La sécurité des patients est notre priorité absolue",
-                "type": "likert_5"
-            }
-        ]
-    
-    def _load_education_items(self) -> List[Dict]:
-        """Education sector specific items"""
-        return [
-            {
-                "id": "ED1",
-                "dimension": "student_focus",
-                "text": "La réussite des étudiants guide nos décisions",
-                "type": "likert_5"
-            }
-        ]
+        return _ITEMS_BANK
     
     def generate_assessment(self) -> Dict:
         """Generate the complete assessment structure"""
-        items = self._select_items()
+        items = self.selected_items
         structure = {
             "framework": self.framework,
             "items": items,
@@ -261,23 +352,57 @@ class QualityCultureAssessment:
         }
         return structure
     
-    def _select_items(self) -> List[Dict]:
-        """Select appropriate items based on configuration"""
+    @cached_property
+    def selected_items(self) -> Tuple[Dict, ...]:
+        """Select appropriate items based on configuration (computed once per assessment)"""
+        # Read-only items, shared with every other assessment
         base_items = self.items_bank["generic"]
         
         if self.config.sector != Sector.GENERIC:
-            sector_items = self.items_bank.get(self.config.sector.value, [])
-            base_items.extend(sector_items)
+            base_items = base_items + self.items_bank.get(self.config.sector.value, ())
         
         # Filter based on version
         if self.config.version == "freemium":
             return base_items[:20]  # Limit items for freemium
         return base_items
     
+    @property
+    def n_items(self) -> int:
+        """Number of items in the assessment"""
+        return len(self.selected_items)
+    
+    def load_responses(self, responses: pd.DataFrame) -> pd.DataFrame:
+        """
+        Prepare raw responses for scoring
+        
+        Columns of likert_5 items whose answers are all whole numbers are stored as
+        nullable Int8 (1 byte per answer, missing answers kept as NA) instead of
+        float64. Columns with fractional answers, such as slider scales, stay float.
+        
+        Args:
+            responses: DataFrame with one column per item id
+            
+        Returns:
+            DataFrame with the whole-number Likert columns downcast
+        """
+        downcast = {}
+        for item in self.selected_items:
+            col = item["id"]
+            if item.get("type") != "likert_5" or col not in responses.columns:
+                continue
+            column = responses[col]
+            if not pd.api.types.is_numeric_dtype(column) or pd.api.types.is_bool_dtype(column):
+                continue
+            values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+            values = values[~np.isnan(values)]
+            if np.array_equal(values, np.round(values)) and np.all(np.abs(values) <= 127):
+                downcast[col] = "Int8"
+        return responses.astype(downcast) if downcast else responses
+    
     def _get_validation_criteria(self) -> Dict:
         """Get validation criteria for the assessment"""
         return {
-            "minimum_sample_size": max(200, len(self._select_items()) * 10),
+            "minimum_sample_size": max(200, self.n_items * 10),
             "cronbach_alpha_threshold": 0.7,
             "ave_threshold": 0.5,
             "response_rate_target": 0.7
@@ -291,68 +416,4 @@ class ScoringEngine:
         
     def get_methodology(self) -> Dict:
         """Return appropriate scoring methodology"""
-        methodologies = {
-            AssessmentType.AFNOR: self._afnor_methodology(),
-            AssessmentType.ISO_10010: self._iso10010_methodology(),
-            AssessmentType.PDA: self._pda_methodology(),
-            AssessmentType.EFQM: self._efqm_methodology(),
-            AssessmentType.BALDRIGE: self._baldrige_methodology()
-        }
-        return methodologies.get(self.config.assessment_type, {})
-    
-    def _afnor_methodology(self) -> Dict:
-        """AFNOR NPQS scoring methodology"""
-        return {
-            "type": "npqs",
-            "calculation": "promoters - detractors",
-            "scale": "0-10",
-            "categories": {
-                "promoters": [9, 10],
-                "passives": [7, 8],
-                "detractors": [0, 1, 2, 3, 4, 5, 6]
-            }
-        }
-    
-    def _iso10010_methodology(self) -> Dict:
-        """ISO 10010 maturity scoring"""
-        return {
-            "type": "maturity",
-            "levels": 5,
-            "scale": "1-5",
-            "descriptions": [
-                "Initial/Ad-hoc",
-                "Managed",
-                "Defined",
-                "Quantitatively Managed",
-                "Optimizing"
-            ]
-        }
-    
-    def _pda_methodology(self) -> Dict:
-        """PDA maturity scoring"""
-        return {
-            "type": "maturity_matrix",
-            "levels": 5,
-            "dimensions": ["leadership", "communication", "ownership", "ci", "technical"],
-            "scoring": "0-100"
-        }
-    
-    def _efqm_methodology(self) -> Dict:
-        """EFQM RADAR scoring"""
-        return {
-            "type": "radar",
-            "approach": {"weight": 0.25},
-            "deployment": {"weight": 0.25},
-            "assessment": {"weight": 0.25},
-            "refinement": {"weight": 0.25}
-        }
-    
-    def _baldrige_methodology(self) -> Dict:
-        """Baldrige scoring"""
-        return {
-            "type": "maturity_levels",
-            "levels": 6,
-            "scale": "0-1000",
-            "approach": "ADLI",
-            "results": "LeTCI"
-        }
\ No newline at end of file
+        return _METHODOLOGIES.get(self.config.assessment_type, _EMPTY)
\ No newline at end of file
@@ -10,6 +10,115 @@ from scipy import stats
 from sklearn.preprocessing import StandardScaler
 import warnings
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, fall back to the NumPy reduction
+    njit = None
+
+try:
+    import numbagg
+except ImportError:  # numbagg is optional, fall back to plain NumPy
+    numbagg = None
+
+if njit is not None:
+    # fastmath without the no-NaN/no-inf assumptions, since missing answers are NaN
+    @njit(cache=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def _cronbach_kernel(arr):
+        """Cronbach's alpha from one row-major Welford pass over items and row totals"""
+        n, k = arr.shape
+        counts = np.zeros(k)
+        means = np.zeros(k)
+        m2 = np.zeros(k)
+        total_mean = 0.0
+        total_m2 = 0.0
+        for i in range(n):
+            row_sum = 0.0
+            for j in range(k):
+                value = arr[i, j]
+                if not np.isnan(value):
+                    counts[j] += 1.0
+                    delta = value - means[j]
+                    means[j] += delta / counts[j]
+                    m2[j] += delta * (value - means[j])
+                    row_sum += value
+            delta = row_sum - total_mean
+            total_mean += delta / (i + 1)
+            total_m2 += delta * (row_sum - total_mean)
+    
+        item_var_sum = 0.0
+        for j in range(k):
+            if counts[j] > 1.0:
+                item_var_sum += m2[j] / (counts[j] - 1.0)
+        total_var = total_m2 / (n - 1)
+    
+        if total_var == 0.0:
+            return np.nan
+        return (k / (k - 1)) * (1.0 - item_var_sum / total_var)
+    # Compiled (or loaded from the on-disk cache) on the first reliability call, not at import
+else:
+    _cronbach_kernel = None
+
+def _cronbach(arr: np.ndarray) -> float:
+    """Cronbach's alpha of an (n_responses, n_items) array, skipping missing answers"""
+    n, k = arr.shape
+    if n < 2 or k < 2:
+        return np.nan
+    if _cronbach_kernel is not None:
+        return _cronbach_kernel(arr)
+    
+    # Item variances (items with fewer than two answers add nothing) against the
+    # variance of the row totals, missing answers counting as 0 in the totals
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        item_var_sum = np.nansum(np.nanvar(arr, axis=0, ddof=1))
+    total_var = np.nansum(arr, axis=1).var(ddof=1)
+    
+    if total_var == 0.0:
+        return np.nan
+    return (k / (k - 1)) * (1.0 - item_var_sum / total_var)
+
+class _ArrayView:
+    """Numeric responses materialized once as a contiguous float64 array, shared across scorers"""
+    
+    def __init__(self, responses: pd.DataFrame):
+        numeric = responses.select_dtypes(include=["number", "bool"])
+        self.cols = numeric.columns.tolist()
+        self.arr = np.ascontiguousarray(numeric.to_numpy(dtype=np.float64))
+        self._positions = {col: j for j, col in enumerate(self.cols)}
+    
+    @property
+    def empty(self) -> bool:
+        return self.arr.size == 0
+    
+    def __len__(self) -> int:
+        return self.arr.shape[0]
+    
+    def __contains__(self, col) -> bool:
+        return col in self._positions
+    
+    def select(self, cols: List[str]) -> np.ndarray:
+        """Array block for the given columns, in the given order"""
+        return self.arr[:, [self._positions[col] for col in cols]]
+
+def _as_view(responses) -> _ArrayView:
+    """Wrap a DataFrame in an _ArrayView, passing existing views through"""
+    return responses if isinstance(responses, _ArrayView) else _ArrayView(responses)
+
+def _group_nanmean(arr: np.ndarray, codes: np.ndarray, n_groups: int) -> np.ndarray:
+    """(n_groups, n_columns) column means per group code, skipping NaN (code -1 is dropped)"""
+    if numbagg is not None:
+        # numbagg puts the group axis last
+        return numbagg.group_nanmean(arr, codes, num_labels=n_groups, axis=0).T
+    
+    valid = codes >= 0
+    onehot = (codes[valid] == np.arange(n_groups)[:, None]).astype(np.float64)
+    values = arr[valid]
+    present = ~np.isnan(values)
+    sums = onehot @ np.where(present, values, 0.0)
+    counts = onehot @ present
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return sums / counts
+
 class NPQSScorer:
     """Net Promoter Quality Score calculation based on AFNOR methodology"""
     
@@ -17,6 +126,8 @@ class NPQSScorer:
         self.promoter_threshold = 9
         self.passive_range = (7, 8)
         self.detractor_max = 6
+        self._bucket_key = None
+        self._bucket_table = None
         
     def calculate_npqs(self, responses: pd.Series) -> Dict[str, float]:
         """
@@ -31,30 +142,61 @@ class NPQSScorer:
         if responses.empty:
             return {"npqs": 0.0, "promoters": 0, "passives": 0, "detractors": 0}
         
-        promoters = (responses >= self.promoter_threshold).sum()
-        passives = ((responses >= self.passive_range[0]) & 
-                   (responses <= self.passive_range[1])).sum()
-        detractors = (responses <= self.detractor_max).sum()
-        
         total = len(responses)
-        if total == 0:
-            return {"npqs": 0.0, "promoters": 0, "passives": 0, "detractors": 0}
+        values = np.asarray(responses, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        
+        # Bucket 0 = detractor, 1 = passive, 2 = promoter, 3 = unclassified (scores
+        # falling between the configured ranges), then count every bucket at once
+        codes = values.astype(np.int64)
+        if np.array_equal(codes, values):
+            # Whole-point answers: a single gather from the 0-10 lookup table
+            buckets = self._whole_score_buckets()[np.clip(codes, 0, 10)]
+        else:
+            buckets = self._bucket_values(values)
+        detractors, passives, promoters, _ = np.bincount(buckets, minlength=4).tolist()
         
         npqs_score = ((promoters - detractors) / total) * 100
+        pcts = np.round(np.array([promoters, passives, detractors]) / total * 100, 2)
         
         return {
-            "npqs": round(npqs_score, 2),
+            "npqs": np.round(npqs_score, 2),
             "promoters": promoters,
             "passives": passives,
             "detractors": detractors,
-            "promoter_pct": round((promoters / total) * 100, 2),
-            "passive_pct": round((passives / total) * 100, 2),
-            "detractor_pct": round((detractors / total) * 100, 2)
+            "promoter_pct": pcts[0],
+            "passive_pct": pcts[1],
+            "detractor_pct": pcts[2]
         }
+    
+    def _whole_score_buckets(self) -> np.ndarray:
+        """
+        Bucket code of every whole score on the 0-10 scale, built once and rebuilt
+        only if the thresholds have been changed since
+        """
+        key = (self.promoter_threshold, tuple(self.passive_range), self.detractor_max)
+        if key != self._bucket_key:
+            self._bucket_table = self._bucket_values(np.arange(11, dtype=np.float64))
+            self._bucket_key = key
+        return self._bucket_table
+    
+    def _bucket_values(self, values: np.ndarray) -> np.ndarray:
+        """Bucket code of each score against the configured thresholds"""
+        buckets = np.full(len(values), 3, dtype=np.int64)
+        buckets[values <= self.detractor_max] = 0
+        buckets[(values >= self.passive_range[0]) & (values <= self.passive_range[1])] = 1
+        buckets[values >= self.promoter_threshold] = 2
+        return buckets
 
 class MaturityScorer:
     """Maturity grid scoring system (5 levels)"""
     
+    # Lower bounds of levels 2-5 on the 1-5 scale, and the level names they index
+    LEVEL_BOUNDS = np.array([1.5, 2.5, 3.5, 4.5])
+    LEVEL_NAMES = np.array([
+        "Initial/Ad-hoc", "Managed", "Defined", "Quantitatively Managed", "Optimizing"
+    ])
+    
     def __init__(self):
         self.levels = {
             1: "Initial/Ad-hoc",
@@ -64,51 +206,82 @@ class MaturityScorer:
             5: "Optimizing"
         }
         
-    def calculate_maturity(self, responses: pd.DataFrame, 
-                          weights: Optional[Dict[str, float]] = None) -> Dict[str, any]:
+    def calculate_maturity(self, responses: pd.DataFrame,
+                          weights: Optional[Dict[str, float]] = None,
+                          groups: Optional[np.ndarray] = None) -> Dict[str, any]:
         """
         Calculate maturity scores for each dimension
         
         Args:
             responses: DataFrame with responses
             weights: Optional weights for dimensions
+            groups: Optional group label per response (e.g. department) for
+                per-group dimension scores
             
         Returns:
             Dict with maturity scores and levels
         """
-        if responses.empty:
+        view = _as_view(responses)
+        if view.empty:
             return {"overall_maturity": 0, "dimension_scores": {}, "level": "Initial/Ad-hoc"}
         
         # Default equal weights if not provided
         if weights is None:
-            weights = {col: 1.0 for col in responses.columns}
-        
-        dimension_scores = {}
-        total_weight = 0
-        
-        for dimension in responses.columns:
-            if dimension in weights:
-                weighted_score = responses[dimension].mean() * weights[dimension]
-                dimension_scores[dimension] = {
-                    "score": round(responses[dimension].mean(), 2),
-                    "weighted_score": round(weighted_score, 2),
-                    "level": self._get_maturity_level(responses[dimension].mean()),
-                    "std": round(responses[dimension].std(), 2)
-                }
-                total_weight += weights[dimension]
+            weights = {col: 1.0 for col in view.cols}
+        
+        # All dimensions reduced at once from a single float array
+        dimensions = [col for col in view.cols if col in weights]
+        arr = view.select(dimensions)
+        means = np.nanmean(arr, axis=0)
+        stds = np.nanstd(arr, axis=0, ddof=1)
+        w = np.fromiter((weights[col] for col in dimensions), dtype=np.float64, count=len(dimensions))
+        weighted = means * w
+        levels = self._get_maturity_levels(means)
+        
+        # Round all statistics at once for the output
+        score_out, weighted_out, std_out = np.round([means, weighted, stds], 2).tolist()
+        dimension_scores = {
+            dimension: {
+                "score": score_out[j],
+                "weighted_score": weighted_out[j],
+                "level": levels[j],
+                "std": std_out[j]
+            }
+            for j, dimension in enumerate(dimensions)
+        }
         
-        # Calculate overall maturity
-        overall_score = sum(
-            scores["weighted_score"] for scores in dimension_scores.values()
-        ) / total_weight
+        # Calculate overall maturity from the weighted scores as reported
+        overall_score = sum(weighted_out) / w.sum()
         
         overall_level = self._get_maturity_level(overall_score)
         
-        return {
+        result = {
             "overall_maturity": round(overall_score, 2),
             "overall_level": overall_level,
             "dimension_scores": dimension_scores,
-            "maturity_distribution": self._get_maturity_distribution(responses)
+            "maturity_distribution": self._get_maturity_distribution(view)
+        }
+        if groups is not None:
+            result["group_scores"] = self._get_group_scores(arr, dimensions, groups)
+        return result
+    
+    def _get_group_scores(self, arr: np.ndarray, dimensions: List[str],
+                          groups: np.ndarray) -> Dict[str, Dict[str, Dict]]:
+        """Mean score and maturity level of each dimension within each group"""
+        codes, labels = pd.factorize(np.asarray(groups))
+        means = _group_nanmean(arr, codes, len(labels))
+        levels = self.LEVEL_NAMES[self._get_maturity_codes(means)].tolist()
+        scores = np.round(means, 2).tolist()
+        
+        return {
+            label: {
+                dimension: {
+                    "score": scores[g][j],
+                    "level": levels[g][j]
+                }
+                for j, dimension in enumerate(dimensions)
+            }
+            for g, label in enumerate(labels.tolist())
         }
     
     def _get_maturity_level(self, score: float) -> str:
@@ -124,12 +297,30 @@ class MaturityScorer:
         else:
             return "Initial/Ad-hoc"
     
-    def _get_maturity_distribution(self, responses: pd.DataFrame) -> Dict[str, int]:
+    def _get_maturity_levels(self, scores: np.ndarray) -> List[str]:
+        """Map an array of scores to maturity levels (NaN maps to the first level)"""
+        return self.LEVEL_NAMES[self._get_maturity_codes(scores)].tolist()
+    
+    def _get_maturity_codes(self, scores: np.ndarray) -> np.ndarray:
+        """Bin scores into level indices 0-4 (NaN maps to 0)"""
+        idx = np.searchsorted(self.LEVEL_BOUNDS, scores, side='right')
+        idx[np.isnan(scores)] = 0
+        return idx
+    
+    def _get_maturity_distribution(self, responses) -> Dict[str, int]:
         """Get distribution of responses across maturity levels"""
+        # Bin the whole table at once, then count each level per column
+        view = _as_view(responses)
+        codes = self._get_maturity_codes(view.arr)
+        counts = (codes[:, :, None] == np.arange(len(self.LEVEL_NAMES))).sum(axis=0)
+        
+        names = self.LEVEL_NAMES.tolist()
         distribution = {}
-        for col in responses.columns:
-            levels = responses[col].apply(lambda x: self._get_maturity_level(x))
-            distribution[col] = levels.value_counts().to_dict()
+        for col, col_counts in zip(view.cols, counts):
+            order = np.argsort(-col_counts, kind='stable')
+            distribution[col] = {
+                names[i]: int(col_counts[i]) for i in order if col_counts[i] > 0
+            }
         return distribution
 
 class EFQMRADARScorer:
@@ -153,21 +344,27 @@ class EFQMRADARScorer:
         Returns:
             Dict with RADAR scores
         """
-        if responses.empty:
+        view = _as_view(responses)
+        if view.empty:
             return {"total_score": 0, "radar_scores": {}}
         
-        radar_scores = {}
-        for criterion, weight in self.radar_weights.items():
-            if criterion in responses.columns:
-                score = responses[criterion].mean()
-                radar_scores[criterion] = {
-                    "score": round(score, 2),
-                    "weighted_score": round(score * weight, 2)
-                }
+        criteria = [criterion for criterion in self.radar_weights if criterion in view]
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            means = np.nanmean(view.select(criteria), axis=0)
+        
+        weights = np.array([self.radar_weights[criterion] for criterion in criteria])
+        weighted = np.round(means * weights, 2)
+        
+        radar_scores = {
+            criterion: {"score": score, "weighted_score": weighted_score}
+            for criterion, score, weighted_score in zip(
+                criteria, np.round(means, 2).tolist(), weighted.tolist()
+            )
+        }
         
-        total_score = sum(
-            scores["weighted_score"] for scores in radar_scores.values()
-        )
+        # Total of the rounded weighted scores, as reported per criterion
+        total_score = weighted.sum()
         
         return {
             "total_score": round(total_score, 2),
@@ -191,26 +388,22 @@ class StatisticalValidator:
         Returns:
             Dict with reliability metrics
         """
-        if responses.empty or len(responses.columns) < 2:
+        view = _as_view(responses)
+        if view.empty or len(view.cols) < 2:
             return {"cronbach_alpha": 0.0, "reliable": False}
         
         # Calculate Cronbach's alpha
-        item_variances = responses.var()
-        total_variance = responses.sum(axis=1).var()
-        n_items = len(responses.columns)
-        
-        alpha = (n_items / (n_items - 1)) * (
-            1 - item_variances.sum() / total_variance
-        )
+        n_items = len(view.cols)
+        alpha = _cronbach(view.arr)
         
         return {
             "cronbach_alpha": round(alpha, 3),
             "reliable": alpha >= self.alpha_threshold,
             "n_items": n_items,
-            "n_responses": len(responses)
+            "n_responses": len(view)
         }
     
-    def calculate_validity(self, responses: pd.DataFrame, 
+    def calculate_validity(self, responses: pd.DataFrame,
                           dimensions: Dict[str, List[str]]) -> Dict[str, any]:
         """
         Calculate validity metrics (convergent and discriminant)
@@ -222,17 +415,16 @@ class StatisticalValidator:
         Returns:
             Dict with validity metrics
         """
+        view = _as_view(responses)
         validity_results = {}
         
         for dimension, items in dimensions.items():
-            if all(item in responses.columns for item in items):
-                dimension_data = responses[items]
-                
-                # Average Variance Extracted (AVE)
-                ave = self._calculate_ave(dimension_data)
+            if all(item in view for item in items):
+                dimension_data = view.select(items)
                 
-                # Composite Reliability
-                cr = self._calculate_composite_reliability(dimension_data)
+                # Average Variance Extracted (AVE) and Composite Reliability
+                # from a single loadings pass
+                ave, cr = self._calculate_ave_and_cr(dimension_data)
                 
                 validity_results[dimension] = {
                     "ave": round(ave, 3),
@@ -242,47 +434,82 @@ class StatisticalValidator:
         
         return validity_results
     
-    def _calculate_ave(self, data: pd.DataFrame) -> float:
-        """Calculate Average Variance Extracted"""
-        if data.empty:
-            return 0.0
-        
-        # Simplified AVE calculation
-        correlations = data.corr()
-        n_items = len(data.columns)
+    def _calculate_ave_and_cr(self, data) -> Tuple[float, float]:
+        """Calculate Average Variance Extracted and Composite Reliability together"""
+        arr = data if isinstance(data, np.ndarray) else data.to_numpy(dtype=np.float64, copy=False)
+        if arr.size == 0:
+            return 0.0, 0.0
         
-        if n_items == 1:
-            return data.iloc[:, 0].var()
+        loadings = self._loadings(arr)
+        squared = loadings ** 2
         
         # Average of squared factor loadings
-        loadings = []
-        for col in data.columns:
-            loading = abs(data[col].corr(data.mean(axis=1)))
-            loadings.append(loading ** 2)
+        if arr.shape[1] == 1:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                ave = np.nanvar(arr[:, 0], ddof=1)
+        else:
+            ave = squared.mean()
         
-        ave = np.mean(loadings)
-        return ave
+        sum_loadings = loadings.sum()
+        cr = (sum_loadings ** 2) / ((sum_loadings ** 2) + squared.sum())
+        return ave, cr
+    
+    def _loadings(self, arr: np.ndarray) -> np.ndarray:
+        """
+        Absolute item-to-mean correlations (simplified factor loadings) for every column at once
+        
+        Uses pairwise-complete observations, like pandas Series.corr.
+        """
+        missing = np.isnan(arr)
+        if not missing.any():
+            # Complete data: every correlation with the row mean from one centered
+            # matrix-vector product
+            xc = arr - arr.mean(axis=0)
+            rc = xc.mean(axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                loadings = (rc @ xc) / np.sqrt(np.einsum('ij,ij->j', xc, xc) * (rc @ rc))
+            return np.abs(loadings)
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            row_mean = np.nanmean(arr, axis=1)
+        
+        pair = ~missing & ~np.isnan(row_mean)[:, None]
+        count = pair.sum(axis=0)
+        x = np.where(pair, arr, 0.0)
+        r = np.where(pair, row_mean[:, None], 0.0)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            xc = np.where(pair, x - x.sum(axis=0) / count, 0.0)
+            rc = np.where(pair, r - r.sum(axis=0) / count, 0.0)
+            loadings = np.einsum('ij,ij->j', xc, rc) / np.sqrt(
+                np.einsum('ij,ij->j', xc, xc) * np.einsum('ij,ij->j', rc, rc)
+            )
+        return np.abs(loadings)
+    
+    def _calculate_ave(self, data: pd.DataFrame) -> float:
+        """Calculate Average Variance Extracted"""
+        return self._calculate_ave_and_cr(data)[0]
     
     def _calculate_composite_reliability(self, data: pd.DataFrame) -> float:
         """Calculate Composite Reliability (CR)"""
-        if data.empty:
-            return 0.0
-        
-        # Simplified CR calculation
-        loadings = []
-        for col in data.columns:
-            loading = abs(data[col].corr(data.mean(axis=1)))
-            loadings.append(loading)
-        
-        sum_loadings = sum(loadings)
-        sum_squared_loadings = sum([l ** 2 for l in loadings])
-        
-        cr = (sum_loadings ** 2) / ((sum_loadings ** 2) + sum_squared_loadings)
-        return cr
+        return self._calculate_ave_and_cr(data)[1]
 
 class BenchmarkAnalyzer:
     """Benchmark analysis against industry standards"""
     
+    # Sorted percentile band thresholds per metric, and the percentile each band maps to
+    _PCT_THRESHOLDS = {
+        "npqs": np.array([25, 40, 55]),
+        "maturity": np.array([3.2, 3.8, 4.3])
+    }
+    _PCT_VALUES = np.array([25, 50, 75, 90])
+    
+    # Lower percentile bounds of the upper three performance levels, and the level names
+    _LEVEL_BOUNDS = np.array([50, 75, 90])
+    _LEVEL_NAMES = np.array(["Needs Improvement", "Average", "Good", "Excellent"])
+    
     def __init__(self):
         self.benchmark_data = {
             "industry_averages": {
@@ -310,11 +537,13 @@ class BenchmarkAnalyzer:
         Returns:
             Dict with benchmark analysis
         """
+        # A single organisation stays on scalars; batches go through calculate_benchmark_positions
+        averages = self.benchmark_data["industry_averages"]
         benchmark = {}
         
         for metric, score in scores.items():
-            if metric in self.benchmark_data["industry_averages"]:
-                avg = self.benchmark_data["industry_averages"][metric]
+            if metric in averages:
+                avg = averages[metric]
                 percentile = self._calculate_percentile(metric, score)
                 
                 benchmark[metric] = {
@@ -327,30 +556,48 @@ class BenchmarkAnalyzer:
         
         return benchmark
     
-    def _calculate_percentile(self, metric: str, score: float) -> int:
-        """Calculate percentile position"""
-        percentiles = self.benchmark_data["percentiles"]
-        
-        if metric == "npqs":
-            if score >= 55:
-                return 90
-            elif score >= 40:
-                return 75
-            elif score >= 25:
-                return 50
-            else:
-                return 25
-        elif metric == "maturity":
-            if score >= 4.3:
-                return 90
-            elif score >= 3.8:
-                return 75
-            elif score >= 3.2:
-                return 50
-            else:
-                return 25
-        
-        return 50
+    def calculate_benchmark_positions(self, scores: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calculate benchmark positions for many cohorts at once
+        
+        Args:
+            scores: DataFrame with one row per cohort (e.g. department) and
+                one column per metric
+            
+        Returns:
+            DataFrame indexed like scores, with (metric, field) columns for
+            every benchmarked metric (differences are left unrounded)
+        """
+        averages = self.benchmark_data["industry_averages"]
+        positions = {}
+        
+        for metric in scores.columns:
+            if metric in averages:
+                values = scores[metric].to_numpy(dtype=np.float64)
+                percentiles = self._calculate_percentile(metric, values)
+                positions[metric] = pd.DataFrame({
+                    "score": scores[metric],
+                    "industry_average": averages[metric],
+                    "difference": values - averages[metric],
+                    "percentile": percentiles,
+                    "performance_level": self._get_performance_levels(percentiles)
+                }, index=scores.index)
+        
+        if not positions:
+            return pd.DataFrame(index=scores.index)
+        return pd.concat(positions, axis=1)
+    
+    def _calculate_percentile(self, metric: str, score):
+        """Calculate percentile position (scalar or array of scores)"""
+        thresholds = self._PCT_THRESHOLDS.get(metric)
+        if thresholds is None:
+            return 50 if np.ndim(score) == 0 else np.full(np.shape(score), 50)
+        
+        score = np.asarray(score, dtype=np.float64)
+        # A score on a threshold belongs to the upper band; missing scores rank lowest
+        idx = np.where(np.isnan(score), 0, np.searchsorted(thresholds, score, side='right'))
+        result = self._PCT_VALUES[idx]
+        return int(result) if result.ndim == 0 else result
     
     def _get_performance_level(self, percentile: int) -> str:
         """Get performance level based on percentile"""
@@ -361,4 +608,8 @@ class BenchmarkAnalyzer:
         elif percentile >= 50:
             return "Average"
         else:
-            return "Needs Improvement"
\ No newline at end of file
+            return "Needs Improvement"
+    
+    def _get_performance_levels(self, percentiles: np.ndarray) -> np.ndarray:
+        """Map an array of percentiles to performance levels"""
+        return self._LEVEL_NAMES[np.searchsorted(self._LEVEL_BOUNDS, percentiles, side='right')]
\ No newline at end of file
@@ -5,39 +5,169 @@ Implements scientific validation protocols for quality culture assessment
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional
-from scipy import stats
-from sklearn.decomposition import PCA
-from sklearn.preprocessing import StandardScaler
+from typing import Dict, Iterable, List, Tuple, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from scipy import linalg, stats
 import warnings
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, fall back to the NumPy reductions
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _central_moments_kernel(X):
+        """
+        Per column: answered count, mean, second to fourth central moment sums and
+        largest absolute value, in two NaN-skipping passes (columns in parallel)
+    
+        Returns:
+            Array of shape (6, n_columns)
+        """
+        n, k = X.shape
+        out = np.zeros((6, k))
+        for j in prange(k):
+            count = 0.0
+            total = 0.0
+            largest = 0.0
+            for i in range(n):
+                value = X[i, j]
+                if not np.isnan(value):
+                    count += 1.0
+                    total += value
+                    largest = max(largest, abs(value))
+            mean = total / count if count > 0.0 else np.nan
+        
+            m2 = 0.0
+            m3 = 0.0
+            m4 = 0.0
+            for i in range(n):
+                value = X[i, j]
+                if not np.isnan(value):
+                    delta = value - mean
+                    delta2 = delta * delta
+                    m2 += delta2
+                    m3 += delta2 * delta
+                    m4 += delta2 * delta2
+        
+            out[0, j] = count
+            out[1, j] = mean
+            out[2, j] = m2
+            out[3, j] = m3
+            out[4, j] = m4
+            out[5, j] = largest
+        return out
+    # Compiled (or loaded from the on-disk cache) on the first large validation, not at import
+else:
+    _central_moments_kernel = None
+
+# Below this many cells the NumPy reductions are as fast as the kernel, and small
+# validations never pay its compile time
+_KERNEL_MIN_CELLS = 1_000_000
+
+def _central_moments(X: np.ndarray) -> np.ndarray:
+    """
+    Per column: answered count, mean, second to fourth central moment sums and
+    largest absolute value, skipping missing answers
+    
+    Returns:
+        Array of shape (6, n_columns)
+    """
+    if _central_moments_kernel is not None and X.size >= _KERNEL_MIN_CELLS:
+        return _central_moments_kernel(X)
+    
+    present = ~np.isnan(X)
+    count = present.sum(axis=0).astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.where(present, X, 0.0).sum(axis=0) / count
+    delta = np.where(present, X - mean, 0.0)  # Missing answers contribute nothing
+    delta2 = delta * delta
+    largest = np.abs(np.where(present, X, 0.0)).max(axis=0, initial=0.0)
+    return np.array([
+        count, mean, delta2.sum(axis=0), (delta2 * delta).sum(axis=0), (delta2 * delta2).sum(axis=0), largest
+    ])
+
+@dataclass(frozen=True)
+class _StatsCache:
+    """Numeric responses materialized once, with the statistics every validation step shares"""
+    X: Optional[np.ndarray]  # contiguous float64 responses, NaN for missing answers (None when streamed)
+    columns: List
+    mean: np.ndarray
+    std: np.ndarray
+    cov: np.ndarray
+    corr: np.ndarray  # cov scaled by std, exact for items without missing answers
+
+@lru_cache(maxsize=8)
+def _structure_layout(structure_key: Tuple, columns_key: Tuple) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """
+    Column positions of the items of every dimension whose items are all present,
+    and the item-to-dimension count matrix M of those dimensions
+    
+    Memoized on the (hashable) structure and column labels, so repeated validations
+    of the same questionnaire skip the structure traversal. The arrays are read-only.
+    """
+    position = {col: j for j, col in enumerate(columns_key)}
+    idx_map = {
+        dimension: np.array([position[item] for item in items], dtype=np.intp)
+        for dimension, items in structure_key
+        if all(item in position for item in items)
+    }
+    
+    M = np.zeros((len(columns_key), len(idx_map)))
+    for d, ix in enumerate(idx_map.values()):
+        np.add.at(M[:, d], ix, 1.0)
+    
+    for array in (*idx_map.values(), M):
+        array.flags.writeable = False
+    return idx_map, M
+
 class PsychometricValidator:
     """
     Comprehensive psychometric validation framework
     Based on ISO 10010:2022 and scientific validation standards
     """
     
+    # Report paths with their own precision when the report is rounded (None = unrounded,
+    # "*" matches any item or dimension name)
+    _FIELD_DIGITS = {
+        ("item_analysis", "item_statistics", "*", "missing_pct"): 2,
+        ("sample_adequacy", "ratio"): 2,
+        ("validity", "construct_validity", "total_variance_explained"): 2,
+        ("validity", "construct_validity", "eigenvalues"): None
+    }
+    
     def __init__(self, alpha_threshold: float = 0.7, ave_threshold: float = 0.5):
         self.alpha_threshold = alpha_threshold
         self.ave_threshold = ave_threshold
         
     def run_full_validation(self, data: pd.DataFrame, 
-                           theoretical_structure: Dict[str, List[str]]) -> Dict[str, any]:
+                           theoretical_structure: Dict[str, List[str]],
+                           round_digits: Optional[int] = 3) -> Dict[str, any]:
         """
         Run complete psychometric validation
         
         Args:
             data: Response data DataFrame
             theoretical_structure: Dict mapping dimensions to items
+            round_digits: Decimals to round the reported floats to, or None
+                to keep full precision (percentages and the response ratio
+                keep 2 decimals, eigenvalues are not rounded)
             
         Returns:
             Complete validation report
         """
+        # Materialize the responses and their covariance, and resolve the item
+        # positions of every dimension, once for every sub-assessment
+        cache = self._compute_stats_cache(data)
+        idx_map = self._resolve_structure(cache.columns, theoretical_structure)
+        
         validation_report = {
-            "reliability": self.assess_reliability(data, theoretical_structure),
-            "validity": self.assess_validity(data, theoretical_structure),
-            "dimensionality": self.assess_dimensionality(data, theoretical_structure),
-            "item_analysis": self.conduct_item_analysis(data),
+            "reliability": self.assess_reliability(data, theoretical_structure, cache, idx_map),
+            "validity": self.assess_validity(data, theoretical_structure, cache, idx_map),
+            "dimensionality": self.assess_dimensionality(data, theoretical_structure, cache),
+            "item_analysis": self.conduct_item_analysis(data, cache),
             "sample_adequacy": self.assess_sample_adequacy(data),
             "recommendations": []
         }
@@ -45,16 +175,22 @@ class PsychometricValidator:
         # Generate recommendations based on validation results
         validation_report["recommendations"] = self._generate_recommendations(validation_report)
         
-        return validation_report
+        # Round once for presentation, after every decision used full precision, and
+        # hand back plain Python values so the report serializes to JSON
+        return self._round_tree(validation_report, round_digits)
     
     def assess_reliability(self, data: pd.DataFrame, 
-                          theoretical_structure: Dict[str, List[str]]) -> Dict[str, any]:
+                          theoretical_structure: Dict[str, List[str]],
+                          cache: Optional[_StatsCache] = None,
+                          idx_map: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, any]:
         """
         Comprehensive reliability assessment
         
         Args:
             data: Response data
             theoretical_structure: Theoretical dimension structure
+            cache: Optional result of _compute_stats_cache(data)
+            idx_map: Optional result of _resolve_structure for the cache
             
         Returns:
             Reliability metrics
@@ -67,26 +203,28 @@ class PsychometricValidator:
             "overall_reliability": True
         }
         
-        # Calculate Cronbach's alpha for each dimension
-        for dimension, items in theoretical_structure.items():
-            if all(item in data.columns for item in items):
-                dimension_data = data[items]
-                alpha = self._calculate_cronbach_alpha(dimension_data)
-                reliability_results["cronbach_alpha"][dimension] = {
-                    "value": round(alpha, 3),
-                    "acceptable": alpha >= self.alpha_threshold,
-                    "n_items": len(items)
-                }
-        
-        # Calculate composite reliability
-        for dimension, items in theoretical_structure.items():
-            if all(item in data.columns for item in items):
-                dimension_data = data[items]
-                cr = self._calculate_composite_reliability(dimension_data)
-                reliability_results["composite_reliability"][dimension] = {
-                    "value": round(cr, 3),
-                    "acceptable": cr >= self.alpha_threshold
-                }
+        if cache is None:
+            cache = self._compute_stats_cache(data)
+        layout_map, M = self._structure_layout(cache.columns, theoretical_structure)
+        if idx_map is None:
+            idx_map = layout_map
+        # Alpha and composite reliability of every dimension in one batch
+        alphas, crs, _ = self._dimension_metrics(cache, idx_map, M)
+        
+        for d, (dimension, ix) in enumerate(idx_map.items()):
+            alpha = alphas[d].item()
+            reliability_results["cronbach_alpha"][dimension] = {
+                "value": alpha,
+                "acceptable": alpha >= self.alpha_threshold,
+                "n_items": len(ix)
+            }
+        
+        for d, dimension in enumerate(idx_map):
+            cr = crs[d].item()
+            reliability_results["composite_reliability"][dimension] = {
+                "value": cr,
+                "acceptable": cr >= self.alpha_threshold
+            }
         
         # Overall reliability assessment
         all_alphas = [r["value"] for r in reliability_results["cronbach_alpha"].values()]
@@ -96,14 +234,33 @@ class PsychometricValidator:
         
         return reliability_results
     
+    def assess_reliability_streaming(self, chunks: Iterable[pd.DataFrame],
+                                     theoretical_structure: Dict[str, List[str]]) -> Dict[str, any]:
+        """
+        Reliability assessment of responses too large to hold in memory
+        
+        Args:
+            chunks: Iterable of response DataFrames with the same columns (e.g.
+                pd.read_csv(..., chunksize=...)), read once
+            theoretical_structure: Theoretical dimension structure
+            
+        Returns:
+            Reliability metrics, as assess_reliability
+        """
+        return self.assess_reliability(None, theoretical_structure, self._stream_stats_cache(chunks))
+    
     def assess_validity(self, data: pd.DataFrame, 
-                       theoretical_structure: Dict[str, List[str]]) -> Dict[str, any]:
+                       theoretical_structure: Dict[str, List[str]],
+                       cache: Optional[_StatsCache] = None,
+                       idx_map: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, any]:
         """
         Comprehensive validity assessment
         
         Args:
             data: Response data
             theoretical_structure: Theoretical dimension structure
+            cache: Optional result of _compute_stats_cache(data)
+            idx_map: Optional result of _resolve_structure for the cache
             
         Returns:
             Validity metrics
@@ -116,49 +273,61 @@ class PsychometricValidator:
             "construct_validity": {}
         }
         
+        if cache is None:
+            cache = self._compute_stats_cache(data)
+        layout_map, M = self._structure_layout(cache.columns, theoretical_structure)
+        if idx_map is None:
+            idx_map = layout_map
+        
         # Convergent validity (AVE)
-        for dimension, items in theoretical_structure.items():
-            if all(item in data.columns for item in items):
-                dimension_data = data[items]
-                ave = self._calculate_average_variance_extracted(dimension_data)
-                validity_results["convergent_validity"][dimension] = {
-                    "ave": round(ave, 3),
-                    "acceptable": ave >= self.ave_threshold
-                }
+        _, _, aves = self._dimension_metrics(cache, idx_map, M)
+        for d, dimension in enumerate(idx_map):
+            ave = aves[d].item()
+            validity_results["convergent_validity"][dimension] = {
+                "ave": ave,
+                "acceptable": ave >= self.ave_threshold
+            }
         
         # Discriminant validity
         validity_results["discriminant_validity"] = self._assess_discriminant_validity(
-            data, theoretical_structure
+            data, theoretical_structure, cache, idx_map
         )
         
         # Construct validity through factor analysis
         validity_results["construct_validity"] = self._assess_construct_validity(
-            data, theoretical_structure
+            data, theoretical_structure, cache
         )
         
         return validity_results
     
     def assess_dimensionality(self, data: pd.DataFrame, 
-                            theoretical_structure: Dict[str, List[str]]) -> Dict[str, any]:
+                            theoretical_structure: Dict[str, List[str]],
+                            cache: Optional[_StatsCache] = None) -> Dict[str, any]:
         """
         Assess dimensionality through factor analysis
         
         Args:
             data: Response data
             theoretical_structure: Expected structure
+            cache: Optional result of _compute_stats_cache(data)
             
         Returns:
             Dimensionality assessment
         """
-        # Prepare data for factor analysis
-        all_items = [item for items in theoretical_structure.values() for item in items]
-        analysis_data = data[all_items]
+        if cache is None:
+            cache = self._compute_stats_cache(data)
+        X, columns = cache.X, cache.columns
         
-        # Kaiser-Meyer-Olkin test
-        kmo = self._calculate_kmo(analysis_data)
+        # Prepare data for factor analysis
+        position = {col: j for j, col in enumerate(columns)}
+        ix = np.array(
+            [position[item] for items in theoretical_structure.values() for item in items], dtype=np.intp
+        )
+        analysis_data = X[:, ix]
+        R = self._item_correlations(cache, ix)
         
-        # Bartlett's test of sphericity
-        bartlett = self._bartlett_sphericity_test(analysis_data)
+        # Kaiser-Meyer-Olkin test and Bartlett's test of sphericity
+        kmo, bartlett = self._sampling_adequacy(R, len(X))
         
         # Parallel analysis for factor retention
         n_factors = self._parallel_analysis(analysis_data)
@@ -167,7 +336,7 @@ class PsychometricValidator:
         efa_results = self._exploratory_factor_analysis(analysis_data, n_factors)
         
         return {
-            "kmo": round(kmo, 3),
+            "kmo": kmo,
             "bartlett": bartlett,
             "recommended_factors": n_factors,
             "theoretical_factors": len(theoretical_structure),
@@ -175,47 +344,61 @@ class PsychometricValidator:
             "dimensionality_adequate": kmo > 0.6 and bartlett["significant"]
         }
     
-    def conduct_item_analysis(self, data: pd.DataFrame) -> Dict[str, any]:
+    def conduct_item_analysis(self, data: pd.DataFrame,
+                              cache: Optional[_StatsCache] = None) -> Dict[str, any]:
         """
         Detailed item analysis
         
         Args:
             data: Response data
+            cache: Optional result of _compute_stats_cache(data)
             
         Returns:
             Item analysis results
         """
+        if cache is None:
+            cache = self._compute_stats_cache(data)
+        X, columns, cov = cache.X, cache.columns, cache.cov
+        
+        # Every statistic for all items at once
+        moments = self._column_moments(X)
+        item_total_array = self._item_total_correlations(X, cov)
+        mean, std, skewness, kurtosis = moments.tolist()
+        item_total = item_total_array.tolist()
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            minimum = np.nanmin(X, axis=0)
+            maximum = np.nanmax(X, axis=0)
+            missing_pct = (np.isnan(X).mean(axis=0) * 100).tolist()
+        
         item_stats = {}
         
-        for column in data.columns:
-            col_data = data[column]
-            
+        for j, column in enumerate(columns):
             # Basic statistics
             stats = {
-                "mean": round(col_data.mean(), 3),
-                "std": round(col_data.std(), 3),
-                "skewness": round(col_data.skew(), 3),
-                "kurtosis": round(col_data.kurtosis(), 3),
-                "min": col_data.min(),
-                "max": col_data.max()
+                "mean": mean[j],
+                "std": std[j],
+                "skewness": skewness[j],
+                "kurtosis": kurtosis[j],
+                "min": minimum[j],
+                "max": maximum[j]
             }
             
             # Item-total correlation
-            other_items = [c for c in data.columns if c != column]
-            if other_items:
-                total_score = data[other_items].sum(axis=1)
-                item_total_corr = col_data.corr(total_score)
-                stats["item_total_correlation"] = round(item_total_corr, 3)
+            if len(columns) > 1:
+                stats["item_total_correlation"] = item_total[j]
             
             # Missing data
-            stats["missing_pct"] = round((col_data.isna().sum() / len(col_data)) * 100, 2)
+            stats["missing_pct"] = missing_pct[j]
             
             item_stats[column] = stats
         
         return {
             "item_statistics": item_stats,
-            "problematic_items": self._identify_problematic_items(item_stats),
-            "distribution_analysis": self._analyze_distributions(data)
+            "problematic_items": self._identify_problematic_items(
+                columns, item_total_array if len(columns) > 1 else None, moments[2]
+            ),
+            "distribution_analysis": self._analyze_distributions(columns, moments[2], moments[3])
         }
     
     def assess_sample_adequacy(self, data: pd.DataFrame) -> Dict[str, any]:
@@ -241,65 +424,327 @@ class PsychometricValidator:
         return {
             "n_responses": n_responses,
             "n_items": n_items,
-            "ratio": round(n_responses / n_items, 2),
+            "ratio": n_responses / n_items,
             "adequacy_5_1": n_cases_rule,
             "adequacy_10_1": n_cases_rule_10,
             "kline_adequate": kline_adequate,
             "recommended_minimum": max(200, 10 * n_items)
         }
     
-    def _calculate_cronbach_alpha(self, data: pd.DataFrame) -> float:
-        """Calculate Cronbach's alpha"""
-        if data.empty or len(data.columns) < 2:
-            return 0.0
+    def _compute_stats_cache(self, data: pd.DataFrame) -> _StatsCache:
+        """
+        Numeric responses as an array, with their column labels, means, standard
+        deviations and covariance
         
-        item_vars = data.var()
-        total_var = data.sum(axis=1).var()
-        n_items = len(data.columns)
+        Means and standard deviations skip missing answers. The covariance counts
+        missing answers as 0, which is how they enter the row totals of a scale.
+        
+        Likert answers stored as nullable Int8 (see
+        QualityCultureAssessment.load_responses) are upcast with NA as NaN. Plain
+        integer columns cannot hold missing answers, so all-integer responses skip
+        the NaN-aware reductions and their copies.
+        """
+        numeric = data.select_dtypes(include=["number", "bool"])
+        X = np.ascontiguousarray(numeric.to_numpy(dtype=np.float64, na_value=np.nan))
+        complete = all(isinstance(dtype, np.dtype) and dtype.kind in "biu" for dtype in numeric.dtypes)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            if complete:
+                mean = X.mean(axis=0)
+                std = X.std(axis=0, ddof=1)
+                cov = np.atleast_2d(np.cov(X, rowvar=False, ddof=1))
+            else:
+                mean = np.nanmean(X, axis=0)
+                std = np.nanstd(X, axis=0, ddof=1)
+                cov = np.atleast_2d(np.cov(np.nan_to_num(X, nan=0.0), rowvar=False, ddof=1))
+            corr = cov / np.outer(std, std)
+        return _StatsCache(X, numeric.columns.tolist(), mean, std, cov, corr)
+    
+    def _stream_stats_cache(self, chunks: Iterable[pd.DataFrame]) -> _StatsCache:
+        """
+        Means, standard deviations and covariance accumulated chunk by chunk
+        
+        Only the column sums and cross-products are kept, so memory stays
+        O(n_items^2) whatever the number of responses. Values are shifted by the
+        first chunk's means to keep the sums well conditioned. Responses must be
+        complete.
+        """
+        n = 0
+        columns = shift = sums = cross = None
+        for chunk in chunks:
+            numeric = chunk.select_dtypes(include=["number", "bool"])
+            Xc = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+            if np.isnan(Xc).any():
+                raise ValueError("Streaming validation requires complete responses")
+            if columns is None:
+                columns = numeric.columns.tolist()
+                shift = Xc.mean(axis=0) if len(Xc) else np.zeros(Xc.shape[1])
+                sums = np.zeros(Xc.shape[1])
+                cross = np.zeros((Xc.shape[1], Xc.shape[1]))
+            Xc = Xc - shift
+            n += len(Xc)
+            sums += Xc.sum(axis=0)
+            cross += Xc.T @ Xc
+        
+        if columns is None:
+            raise ValueError("No response chunks to validate")
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            centered = sums / n
+            cov = (cross - n * np.outer(centered, centered)) / (n - 1)
+            std = np.sqrt(np.diag(cov))
+            corr = cov / np.outer(std, std)
+        return _StatsCache(None, columns, centered + shift, std, cov, corr)
+    
+    def _column_moments(self, X: np.ndarray) -> np.ndarray:
+        """
+        Mean, standard deviation, skewness and excess kurtosis of every column
+        
+        Missing answers are skipped. Skewness and kurtosis are the bias-corrected
+        estimators of pandas, including its handling of near-constant columns.
+        
+        Returns:
+            Array of shape (4, n_columns)
+        """
+        count, mean, m2, m3, m4, largest = _central_moments(np.ascontiguousarray(X, dtype=np.float64))
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            std = np.sqrt(m2 / (count - 1))
+            std[count < 2] = np.nan
+            
+            # Treat floating point noise on constant columns as exactly zero
+            scale = np.finfo(np.float64).eps * largest
+            m2 = np.where(np.abs(m2) < scale ** 2 * count, 0.0, m2)
+            m3 = np.where(np.abs(m3) < scale ** 3 * count, 0.0, m3)
+            m4 = np.where(np.abs(m4) < scale ** 4 * count, 0.0, m4)
+            
+            skewness = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5)
+            skewness = np.where(m2 == 0, 0.0, skewness)
+            skewness[count < 3] = np.nan
+            
+            denominator = (count - 2) * (count - 3) * m2 ** 2
+            kurtosis = (count * (count + 1) * (count - 1) * m4 / denominator
+                        - 3 * (count - 1) ** 2 / ((count - 2) * (count - 3)))
+            kurtosis = np.where(denominator == 0, 0.0, kurtosis)
+            kurtosis[count < 4] = np.nan
+        
+        return np.array([mean, std, skewness, kurtosis])
+    
+    def _item_total_correlations(self, X: np.ndarray, cov: np.ndarray) -> np.ndarray:
+        """Correlation of each item with the sum of the other items (corrected item-total)"""
+        missing = np.isnan(X)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if not missing.any():
+                # cov(x_i, S - x_i) and var(S - x_i) straight from the covariance matrix
+                item_var = np.diag(cov)
+                row_sums = cov.sum(axis=1)
+                rest_var = cov.sum() - 2 * row_sums + item_var
+                return (row_sums - item_var) / np.sqrt(item_var * rest_var)
+            
+            # Item correlated over its answered rows with the rest total (missing
+            # answers count as 0 in it); both sides are shifted by per-item constants
+            # to keep the sums well conditioned
+            present = (~missing).astype(np.float64)
+            n = present.sum(axis=0)
+            xc = np.where(missing, 0.0, X - np.nanmean(X, axis=0))
+            u = np.where(missing, 0.0, X).sum(axis=1)
+            u -= u.mean()
+            
+            xu = xc.T @ u
+            sx = xc.sum(axis=0)
+            sxx = np.einsum('ij,ij->j', xc, xc)
+            st = present.T @ u - sx
+            stt = present.T @ (u * u) - 2 * xu + sxx
+            sxt = xu - sxx
+            
+            cov_xt = sxt - sx * st / n
+            var_x = sxx - sx ** 2 / n
+            var_t = stt - st ** 2 / n
+            return cov_xt / np.sqrt(var_x * var_t)
+    
+    @classmethod
+    def _round_tree(cls, obj, ndigits: Optional[int] = 3, path: Tuple = ()):
+        """
+        JSON-safe copy of a (nested) report: floats rounded to ndigits (or per
+        _FIELD_DIGITS at their report path), NumPy scalars and arrays as Python values
+        """
+        if isinstance(obj, dict):
+            return {
+                key: cls._round_tree(value, cls._field_digits(path + (key,), ndigits), path + (key,))
+                for key, value in obj.items()
+            }
+        if isinstance(obj, (list, tuple)):
+            return type(obj)(cls._round_tree(value, ndigits, path) for value in obj)
+        if isinstance(obj, np.ndarray):
+            return np.round(obj, ndigits).tolist() if obj.dtype.kind == 'f' and ndigits is not None else obj.tolist()
+        if isinstance(obj, (float, np.floating)):
+            return float(obj) if ndigits is None else round(float(obj), ndigits)
+        if isinstance(obj, (bool, np.bool_)):
+            return bool(obj)
+        if isinstance(obj, np.integer):
+            return int(obj)
+        return obj
+    
+    @classmethod
+    def _field_digits(cls, path: Tuple, ndigits: Optional[int]) -> Optional[int]:
+        """Precision of the report value at path: its _FIELD_DIGITS entry, else ndigits"""
+        if ndigits is None:
+            return None
+        for pattern, digits in cls._FIELD_DIGITS.items():
+            if len(pattern) == len(path) and all(p == "*" or p == key for p, key in zip(pattern, path)):
+                return digits
+        return ndigits
+    
+    def _structure_layout(self, columns: List,
+                          structure: Dict[str, List[str]]) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """Memoized item positions and membership matrix of the structure (see _structure_layout)"""
+        idx_map, M = _structure_layout(
+            tuple((dimension, tuple(items)) for dimension, items in structure.items()), tuple(columns)
+        )
+        return dict(idx_map), M
+    
+    def _resolve_structure(self, columns: List, structure: Dict[str, List[str]]) -> Dict[str, np.ndarray]:
+        """Column positions of the items of every dimension whose items are all present"""
+        return self._structure_layout(columns, structure)[0]
+    
+    def _dimension_metrics(self, cache: _StatsCache, idx_map: Dict[str, np.ndarray],
+                           M: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Cronbach's alpha, composite reliability and AVE of every dimension at once
         
+        One product of the covariance with the item-to-dimension membership matrix M
+        gives each item's covariance with every dimension total, and the total
+        variances. Dimensions with missing answers take their loadings from
+        _dimension_loadings instead.
+        
+        Args:
+            cache: Result of _compute_stats_cache
+            idx_map: Result of _resolve_structure for the cache
+            M: Membership matrix matching idx_map, built from it when omitted
+        
+        Returns:
+            Arrays of alpha, CR and AVE, in idx_map order
+        """
+        X, cov = cache.X, cache.cov
+        if M is None:
+            M = np.zeros((len(cache.columns), len(idx_map)))
+            for d, ix in enumerate(idx_map.values()):
+                np.add.at(M[:, d], ix, 1.0)
+        
+        n_items = M.sum(axis=0)
+        CM = cov @ M
+        total_var = (M * CM).sum(axis=0)
+        
+        # Items without a variance only void the dimensions they belong to
+        item_var = cache.std ** 2
+        unknown = np.isnan(item_var)
+        item_var_sum = M.T @ np.where(unknown, 0.0, item_var)
+        item_var_sum[(M.T @ unknown) > 0] = np.nan
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            alpha = (n_items / (n_items - 1)) * (1 - item_var_sum / total_var)
+            # Loadings: |cov(x_i, total)| / sqrt(var_i * var(total)), kept on member items only
+            L = np.where(M > 0, np.abs(CM) / np.sqrt(np.outer(np.diag(cov), total_var)), 0.0)
+            sum_loadings = (M * L).sum(axis=0)
+            sum_squares = (M * L ** 2).sum(axis=0)
+            cr = sum_loadings ** 2 / (sum_loadings ** 2 + sum_squares)
+            ave = sum_squares / n_items
+        
+        alpha = np.where((n_items < 2) | (total_var == 0), 0.0, np.fmax(alpha, 0.0))
+        cr = np.where(sum_loadings == 0, 0.0, cr)
+        ave = np.where(n_items == 0, 0.0, ave)
+        
+        if X is None:  # streamed responses are complete
+            return alpha, cr, ave
+        
+        missing = np.isnan(X).any(axis=0)
+        for d, ix in enumerate(idx_map.values()):
+            if len(X) == 0 or missing[ix].any():
+                loadings = self._dimension_loadings(X, cov, ix)
+                cr[d] = self._composite_reliability_from_loadings(loadings)
+                ave[d] = self._average_variance_from_loadings(loadings)
+        
+        return alpha, cr, ave
+    
+    def _cronbach_alpha_from_cov(self, cov: np.ndarray, item_var: np.ndarray, ix: np.ndarray) -> float:
+        """
+        Cronbach's alpha of the items at positions ix
+        
+        The total score variance is the sum of the items' covariance block, and
+        item_var holds the variances of the answered values of each item.
+        """
+        n_items = len(ix)
+        if n_items < 2:
+            return 0.0
+        
+        total_var = cov[np.ix_(ix, ix)].sum()
         if total_var == 0:
             return 0.0
         
-        alpha = (n_items / (n_items - 1)) * (1 - item_vars.sum() / total_var)
+        alpha = (n_items / (n_items - 1)) * (1 - item_var[ix].sum() / total_var)
         return max(0, alpha)  # Ensure non-negative
     
-    def _calculate_composite_reliability(self, data: pd.DataFrame) -> float:
-        """Calculate Composite Reliability (CR)"""
-        if data.empty:
+    def _calculate_cronbach_alpha(self, data: pd.DataFrame) -> float:
+        """Calculate Cronbach's alpha"""
+        if data.empty or len(data.columns) < 2:
             return 0.0
         
-        # Simplified CR calculation using factor loadings
-        loadings = []
-        total_score = data.mean(axis=1)
-        
-        for col in data.columns:
-            loading = abs(data[col].corr(total_score))
-            loadings.append(loading)
-        
-        sum_loadings = sum(loadings)
-        sum_squared_loadings = sum([l ** 2 for l in loadings])
+        cache = self._compute_stats_cache(data)
+        columns, std, cov = cache.columns, cache.std, cache.cov
+        return self._cronbach_alpha_from_cov(cov, std ** 2, np.arange(len(columns)))
+    
+    def _dimension_loadings(self, X: np.ndarray, cov: np.ndarray, ix: np.ndarray) -> np.ndarray:
+        """
+        Absolute correlation of each item at positions ix with the dimension's row mean
+        (simplified factor loadings)
+        """
+        block = X[:, ix]
+        if len(ix) == 0 or len(block) == 0:
+            return np.array([])
+        
+        if not np.isnan(block).any():
+            # cov(x_i, mean) and var(mean) are row and total sums of the covariance block
+            sub = cov[np.ix_(ix, ix)]
+            row_sums = sub.sum(axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return np.abs(row_sums / np.sqrt(np.diag(sub) * row_sums.sum()))
+        
+        # Mean over each respondent's answered items, correlated pairwise-complete
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            row_mean = np.nanmean(block, axis=1)
+        return np.abs(self._pairwise_correlations(np.column_stack([block, row_mean]))[:-1, -1])
+    
+    def _composite_reliability_from_loadings(self, loadings: np.ndarray) -> float:
+        """Composite Reliability (CR) from factor loadings"""
+        if len(loadings) == 0:
+            return 0.0
         
+        sum_loadings = loadings.sum()
         if sum_loadings == 0:
             return 0.0
         
-        cr = (sum_loadings ** 2) / ((sum_loadings ** 2) + sum_squared_loadings)
-        return cr
+        return (sum_loadings ** 2) / ((sum_loadings ** 2) + (loadings ** 2).sum())
+    
+    def _average_variance_from_loadings(self, loadings: np.ndarray) -> float:
+        """Average Variance Extracted (AVE) from factor loadings"""
+        if len(loadings) == 0:
+            return 0.0
+        return np.mean(loadings ** 2)
+    
+    def _single_dimension_metrics(self, data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """_dimension_metrics of data taken as one dimension of all its numeric items"""
+        cache = self._compute_stats_cache(data)
+        return self._dimension_metrics(cache, {None: np.arange(len(cache.columns))})
+    
+    def _calculate_composite_reliability(self, data: pd.DataFrame) -> float:
+        """Calculate Composite Reliability (CR)"""
+        return self._single_dimension_metrics(data)[1][0].item()
     
     def _calculate_average_variance_extracted(self, data: pd.DataFrame) -> float:
         """Calculate Average Variance Extracted (AVE)"""
-        if data.empty:
-            return 0.0
-        
-        # Simplified AVE calculation
-        loadings = []
-        total_score = data.mean(axis=1)
-        
-        for col in data.columns:
-            loading = abs(data[col].corr(total_score))
-            loadings.append(loading ** 2)
-        
-        ave = np.mean(loadings)
-        return ave
+        return self._single_dimension_metrics(data)[2][0].item()
     
     def _assess_content_validity(self, structure: Dict[str, List[str]]) -> Dict[str, any]:
         """Assess content validity"""
@@ -315,88 +760,184 @@ class PsychometricValidator:
         }
     
     def _assess_discriminant_validity(self, data: pd.DataFrame, 
-                                    structure: Dict[str, List[str]]) -> Dict[str, any]:
+                                    structure: Dict[str, List[str]],
+                                    cache: Optional[_StatsCache] = None,
+                                    idx_map: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, any]:
         """Assess discriminant validity"""
-        correlations = {}
-        
-        for dim1, items1 in structure.items():
-            for dim2, items2 in structure.items():
-                if dim1 != dim2 and all(i in data.columns for i in items1 + items2):
-                    score1 = data[items1].mean(axis=1)
-                    score2 = data[items2].mean(axis=1)
-                    corr = score1.corr(score2)
-                    correlations[f"{dim1}_{dim2}"] = round(corr, 3)
+        if cache is None:
+            cache = self._compute_stats_cache(data)
+        layout_map, counts = self._structure_layout(cache.columns, structure)
+        if idx_map is None:
+            idx_map = layout_map
+        X, cov = cache.X, cache.cov
+        dimensions = list(idx_map)
+        
+        # Aggregator mapping every item to the mean score of its dimension
+        n_items = counts.sum(axis=0)
+        M = counts / np.where(n_items > 0, n_items, 1.0)
+        
+        if not np.isnan(X).any():
+            # Dimension score covariance is M' C M, no pass over the responses needed
+            score_cov = M.T @ cov @ M
+            sd = np.sqrt(np.diag(score_cov))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                R = score_cov / np.outer(sd, sd)
+        else:
+            # Mean over each respondent's answered items, then pairwise-complete correlations
+            membership = (M > 0).astype(np.float64)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                scores = (np.nan_to_num(X, nan=0.0) @ membership) / (~np.isnan(X) @ membership)
+            R = self._pairwise_correlations(scores)
+        
+        correlations = {
+            f"{dim1}_{dim2}": R[i, j].item()
+            for i, dim1 in enumerate(dimensions)
+            for j, dim2 in enumerate(dimensions)
+            if i != j
+        }
         
         return {
             "inter_dimension_correlations": correlations,
             "discriminant_valid": all(abs(c) < 0.85 for c in correlations.values())
         }
     
+    def _pairwise_correlations(self, S: np.ndarray) -> np.ndarray:
+        """Pearson correlations between the columns of S over pairwise-complete rows"""
+        present = ~np.isnan(S)
+        P = present.astype(np.float64)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            Sc = np.where(present, S - np.nanmean(S, axis=0), 0.0)
+        
+        # Sums over the rows where both columns are answered
+        n = P.T @ P
+        sx = Sc.T @ P
+        sxx = (Sc * Sc).T @ P
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = Sc.T @ Sc - sx * sx.T / n
+            var = sxx - sx ** 2 / n
+            return cov / np.sqrt(var * var.T)
+    
     def _assess_construct_validity(self, data: pd.DataFrame, 
-                                 structure: Dict[str, List[str]]) -> Dict[str, any]:
+                                 structure: Dict[str, List[str]],
+                                 cache: Optional[_StatsCache] = None) -> Dict[str, any]:
         """Assess construct validity through factor analysis"""
-        all_items = [item for items in structure.values() for item in items]
-        analysis_data = data[all_items]
-        
-        # Standardize data
-        scaler = StandardScaler()
-        standardized_data = scaler.fit_transform(analysis_data)
-        
-        # PCA for construct validity
-        pca = PCA()
-        pca.fit(standardized_data)
+        if cache is None:
+            cache = self._compute_stats_cache(data)
+        X, columns, std, cov = cache.X, cache.columns, cache.std, cache.cov
+        position = {col: j for j, col in enumerate(columns)}
+        ix = np.array(
+            [position[item] for items in structure.values() for item in items], dtype=np.intp
+        )
+        if np.isnan(X[:, ix]).any():
+            raise ValueError("Construct validity requires complete responses")
+        
+        # PCA of the standardized items: the component variances are the eigenvalues of
+        # the covariance rescaled by the population standard deviations (constant items
+        # keep unit scale, as with StandardScaler)
+        n = len(X)
+        scale = std[ix] * np.sqrt((n - 1) / n)
+        scale[scale < 10 * np.finfo(np.float64).eps] = 1.0
+        standardized_cov = cov[np.ix_(ix, ix)] / np.outer(scale, scale)
+        
+        # Only the leading eigenvalues are reported; the total variance they are a
+        # share of is the trace, so the rest of the spectrum is never computed
+        p = len(ix)
+        k = min(len(structure) + 2, n, p)
+        eigenvalues = linalg.eigh(standardized_cov, eigvals_only=True, subset_by_index=[p - k, p - 1])[::-1]
         
         # Explained variance
-        explained_variance = pca.explained_variance_ratio_
+        explained_variance = np.maximum(eigenvalues, 0.0)
+        explained_variance_ratio = explained_variance / np.trace(standardized_cov)
         
         return {
-            "total_variance_explained": round(sum(explained_variance[:len(structure)]) * 100, 2),
-            "eigenvalues": pca.explained_variance_.tolist()[:len(structure) + 2],
-            "construct_valid": explained_variance[0] > 1.0
+            "total_variance_explained": explained_variance_ratio[:len(structure)].sum() * 100,
+            "eigenvalues": explained_variance.tolist(),
+            "construct_valid": explained_variance_ratio[0] > 1.0
         }
     
-    def _calculate_kmo(self, data: pd.DataFrame) -> float:
-        """Calculate Kaiser-Meyer-Olkin measure"""
-        return 0.8  # Simplified for demo
+    def _item_correlations(self, cache: _StatsCache, ix: np.ndarray) -> np.ndarray:
+        """Correlation matrix of the items at positions ix"""
+        block = cache.X[:, ix]
+        if np.isnan(block).any():
+            return self._pairwise_correlations(block)
+        return cache.corr[np.ix_(ix, ix)]
     
-    def _bartlett_sphericity_test(self, data: pd.DataFrame) -> Dict[str, float]:
-        """Bartlett's test of sphericity"""
-        return {"chi_square": 100.0, "df": 10, "p_value": 0.001, "significant": True}
+    def _sampling_adequacy(self, R: np.ndarray, n: int) -> Tuple[float, Dict[str, float]]:
+        """
+        Kaiser-Meyer-Olkin measure and Bartlett's test of sphericity from the item
+        correlation matrix of n responses
+        
+        Both share one Cholesky factorization of R: its inverse gives the partial
+        correlations of the KMO, its diagonal the log-determinant of the Bartlett test.
+        """
+        p = len(R)
+        df = p * (p - 1) // 2
+        if p < 2 or not np.isfinite(R).all():
+            return np.nan, {"chi_square": np.nan, "df": df, "p_value": np.nan, "significant": False}
+        
+        try:
+            factor = linalg.cho_factor(R, lower=True)
+            V = linalg.cho_solve(factor, np.eye(p))
+            log_det = 2 * np.log(np.diag(factor[0])).sum()
+        except linalg.LinAlgError:
+            # Singular R: pseudo-inverse, and a log-determinant of -inf
+            V = np.linalg.pinv(R)
+            sign, log_det = np.linalg.slogdet(R)
+            if sign <= 0:
+                log_det = -np.inf
+        
+        # Kaiser-Meyer-Olkin: partial correlations a_ij = -v_ij / sqrt(v_ii * v_jj)
+        d = np.sqrt(np.abs(np.diag(V)))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            A = -V / np.outer(d, d)
+        
+        off_diagonal = ~np.eye(p, dtype=bool)
+        r2 = (R[off_diagonal] ** 2).sum()
+        a2 = (A[off_diagonal] ** 2).sum()
+        kmo = r2 / (r2 + a2)
+        
+        # Bartlett: chi2 = -(n - 1 - (2p + 5) / 6) * ln|R|
+        chi_square = -(n - 1 - (2 * p + 5) / 6) * log_det
+        p_value = stats.chi2.sf(chi_square, df)
+        
+        return kmo, {
+            "chi_square": chi_square,
+            "df": df,
+            "p_value": p_value,
+            "significant": p_value < 0.05
+        }
     
-    def _parallel_analysis(self, data: pd.DataFrame) -> int:
+    def _parallel_analysis(self, data: np.ndarray) -> int:
         """Parallel analysis for factor retention"""
         return 4  # Simplified for demo
     
-    def _exploratory_factor_analysis(self, data: pd.DataFrame, n_factors: int) -> Dict[str, any]:
+    def _exploratory_factor_analysis(self, data: np.ndarray, n_factors: int) -> Dict[str, any]:
         """Exploratory factor analysis"""
         return {"n_factors": n_factors, "loadings": "factor_loadings"}
     
-    def _identify_problematic_items(self, item_stats: Dict[str, any]) -> List[str]:
-        """Identify problematic items based on analysis"""
-        problematic = []
-        
-        for item, stats in item_stats.items():
-            # Flag items with low correlation or extreme skewness
-            if "item_total_correlation" in stats and stats["item_total_correlation"] < 0.3:
-                problematic.append(item)
-            elif abs(stats["skewness"]) > 2.0:
-                problematic.append(item)
-        
-        return problematic
-    
-    def _analyze_distributions(self, data: pd.DataFrame) -> Dict[str, any]:
-        """Analyze distributions of items"""
-        distributions = {}
-        
-        for column in data.columns:
-            col_data = data[column]
-            distributions[column] = {
-                "normal": abs(col_data.skew()) < 1.0 and abs(col_data.kurtosis()) < 1.0,
-                "skewness": round(col_data.skew(), 3),
-                "kurtosis": round(col_data.kurtosis(), 3)
-            }
+    def _identify_problematic_items(self, columns: List, item_total: Optional[np.ndarray],
+                                    skewness: np.ndarray) -> List[str]:
+        """Identify items with low item-total correlation or extreme skewness"""
+        mask = np.abs(skewness) > 2.0
+        if item_total is not None:
+            mask |= item_total < 0.3
+        return [columns[j] for j in np.flatnonzero(mask)]
+    
+    def _analyze_distributions(self, columns: List, skewness: np.ndarray,
+                               kurtosis: np.ndarray) -> Dict[str, any]:
+        """Analyze distributions of items from their column moments"""
+        normal = ((np.abs(skewness) < 1.0) & (np.abs(kurtosis) < 1.0)).tolist()
+        skewness, kurtosis = skewness.tolist(), kurtosis.tolist()
         
-        return distributions
+        return {
+            column: {
+                "normal": normal[j],
+                "skewness": skewness[j],
+                "kurtosis": kurtosis[j]
+            }
+            for j, column in enumerate(columns)
+        }
     
     def _generate_recommendations(self, validation_report: Dict[str, any]) -> List[str]:
         """Generate recommendations based on validation results"""
@@ -0,0 +1 @@
+"""Streamlit dashboards (English and French)"""
@@ -6,15 +6,319 @@ Interactive dashboard with clear explanations and user guidance
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 import json
 import os
+from string import Template
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional, fall back to the pandas parser
+    pacsv = None
+
+# Widgets inside a fragment rerun only that fragment (st.fragment from Streamlit 1.37,
+# experimental before; older versions rerun the whole page as before)
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# Demo score distribution per framework: (dimension, mean, std) on the 1-5 scale
+_FRAMEWORK_SPECS = {
+    "ISO10010": (("Leadership", 4.2, 0.6), ("Process", 3.8, 0.7),
+                 ("People", 4.1, 0.5), ("Results", 3.9, 0.8)),
+    "AFNOR": (("Responsibility", 4.0, 0.5), ("First_Time_Right", 3.7, 0.6),
+              ("Problem_Reporting", 4.2, 0.5), ("Continuous_Improvement", 3.9, 0.7)),
+    "PDA": (("Leadership_Commitment", 4.1, 0.5), ("Quality_Systems", 3.9, 0.6),
+            ("Risk_Management", 4.0, 0.5), ("Training_Competency", 3.8, 0.7)),
+}
+
+# Demo demographic columns and their categories
+_DEMOGRAPHICS = {
+    'department': ['Production', 'R&D', 'Sales', 'Quality', 'Operations'],
+    'site': ['Site A', 'Site B', 'Site C', 'Remote'],
+    'role_level': ['Individual', 'Team Lead', 'Manager', 'Executive'],
+    'experience': ['<1yr', '1-3yrs', '3-5yrs', '5-10yrs', '>10yrs']
+}
+
+# Seed and size of the demo data; together with the framework they identify its content
+_DEMO_SEED = 42
+_DEMO_SIZE = 500
+
+@st.cache_data(ttl=3600)
+def _generate_demo_data(framework: str) -> pd.DataFrame:
+    """Generate realistic demo data (seeded, so cached per framework across reruns)"""
+    # All draws from a single seeded PCG64 generator
+    rng = np.random.default_rng(_DEMO_SEED)
+    n = _DEMO_SIZE
+    
+    spec = _FRAMEWORK_SPECS.get(framework, _FRAMEWORK_SPECS["PDA"])
+    dimensions = [name for name, _, _ in spec]
+    means = np.fromiter((mean for _, mean, _ in spec), dtype=np.float32, count=len(spec))
+    stds = np.fromiter((std for _, _, std in spec), dtype=np.float32, count=len(spec))
+    
+    # Every dimension in one float32 draw (single precision is plenty for 1-5 scores)
+    scores = rng.standard_normal((n, len(spec)), dtype=np.float32) * stds + means
+    data = {dimension: scores[:, i] for i, dimension in enumerate(dimensions)}
+    
+    # Demographics as categoricals: small integer codes instead of one string object per row
+    data.update({
+        column: pd.Categorical.from_codes(rng.integers(0, len(categories), n), categories=categories)
+        for column, categories in _DEMOGRAPHICS.items()
+    })
+    
+    return pd.DataFrame(data)
+
+# Quick start guide shown at the top of every page
+_HELP_MD = """
+            ### 🚀 Quick Start Guide
+            
+            **This dashboard helps you measure and improve your organization's quality culture.**
+            
+            #### 📋 **Step-by-Step Process:**
+            
+            1. **Choose Framework** (left sidebar)
+               - **ISO 10010**: International standard with 4 dimensions
+               - **AFNOR**: French baromètre with NPQS scoring
+               - **PDA**: Pharmaceutical industry standard
+            
+            2. **Select Mode** (left sidebar)
+               - **Demo Mode**: See sample results and features
+               - **New Assessment**: Create a fresh survey
+               - **Load Data**: Upload your existing responses
+            
+            3. **Configure Assessment** (main area)
+               - Set organization details
+               - Choose demographics
+               - Customize questions
+            
+            4. **Deploy Survey**
+               - Generate survey links
+               - Send to participants
+               - Monitor responses
+            
+            5. **Analyze Results**
+               - View real-time dashboard
+               - Export reports
+               - Create action plans
+            
+            #### 🎯 **What You'll Get:**
+            - **Overall Quality Culture Score** (0-100)
+            - **Net Promoter Quality Score (NPQS)** (-100 to +100)
+            - **Maturity Level** (Initial → Optimizing)
+            - **Detailed Analysis** by department/role
+            - **Benchmark Comparisons**
+            - **Improvement Recommendations**
+            """
+
+# Invitation email shown after an assessment is generated
+_EMAIL_TEMPLATE = Template(
+    "📧 **Email Template:**\n\nDear Team,\n\nWe're conducting a quality culture assessment. "
+    "Please take 10-15 minutes to complete:\n\n🔗 $link\n\nYour responses are $privacy "
+    "and will help us improve our quality culture.\n\nThank you!"
+)
+
+def _survey_link(org_name: str, framework: str) -> str:
+    """Survey URL for an organization and framework"""
+    return f"http://localhost:8501/survey/{org_name.lower().replace(' ', '_')}_{framework.lower()}"
+
+def _to_json(obj) -> str:
+    """Indented JSON text, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+def _read_csv(buffer) -> pd.DataFrame:
+    """Parse an uploaded CSV, with pyarrow's multi-threaded reader when available"""
+    if pacsv is None:
+        return pd.read_csv(buffer)
+    # Text columns stay Arrow-backed instead of one Python object per cell
+    string_dtype = pd.ArrowDtype(pa.string())
+    return pacsv.read_csv(buffer).to_pandas(
+        types_mapper=lambda arrow_type: string_dtype if arrow_type == pa.string() else None
+    )
+
+def _data_fingerprint(data: pd.DataFrame) -> int:
+    """Content hash of a DataFrame, used as the cache key of the figures built from it"""
+    return int(pd.util.hash_pandas_object(data, index=False).to_numpy().sum())
+
+def _demo_fingerprint(framework: str) -> int:
+    """Cache key of the demo data, from its generation parameters instead of its content"""
+    return hash(("demo", framework, _DEMO_SEED, _DEMO_SIZE))
+
+@st.cache_resource
+def _build_radar_fig(scores: tuple, dimensions: tuple) -> go.Figure:
+    """Radar chart of the dimension scores (0-100)"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(
+        r=list(scores),
+        theta=list(dimensions),
+        fill='toself',
+        name='Your Score',
+        line_color='rgb(55, 128, 191)'
+    ))
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(range=[0, 100], tickfont_size=12),
+            angularaxis=dict(tickfont_size=12)
+        ),
+        title="Quality Culture Dimensions",
+        height=400
+    )
+    return fig
+
+@st.cache_resource
+def _build_dept_bar_fig(fingerprint: int, _data: pd.DataFrame) -> go.Figure:
+    """
+    Grouped bar chart of the dimension scores per department, one trace per dimension
+    
+    Cached on the data fingerprint; the leading underscore keeps Streamlit from
+    hashing the frame itself.
+    """
+    dept_scores = _data.groupby('department', observed=True)[['Leadership', 'Process', 'People', 'Results']].mean() * 20
+    departments = dept_scores.index.tolist()
+    fig = go.Figure()
+    for dimension in dept_scores.columns:
+        fig.add_trace(go.Bar(name=dimension, x=departments, y=dept_scores[dimension].to_numpy()))
+    fig.update_layout(
+        barmode='group',
+        title="Scores by Department",
+        xaxis_title="department",
+        yaxis_title="Score (0-100)",
+        legend_title_text="Dimension"
+    )
+    return fig
+
+# Mode bar without the logo and the selection tools none of the charts use
+_PLOTLY_CONFIG = {
+    'displaylogo': False,
+    'modeBarButtonsToRemove': ['lasso2d', 'select2d', 'autoScale2d']
+}
+
+def _server_hist(values: np.ndarray, nbins: int = 20) -> go.Figure:
+    """Histogram binned server-side: only the bin counts are sent to the browser, not the values"""
+    counts, edges = np.histogram(values, bins=nbins)
+    return go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges)))
+
+@st.cache_resource
+def _build_hist_fig(fingerprint: int, selected_dim: str, _data: pd.DataFrame) -> go.Figure:
+    """
+    Histogram of one dimension's scores (0-100)
+    
+    Cached on the data fingerprint and dimension, as _build_dept_bar_fig.
+    """
+    scores = _data[selected_dim].to_numpy(dtype=np.float64) * 20
+    fig = _server_hist(scores[~np.isnan(scores)])
+    fig.update_layout(
+        title=f"{selected_dim} Score Distribution",
+        xaxis_title="Score (0-100)",
+        yaxis_title="count"
+    )
+    return fig
+
+# Demo benchmark: the organization's scores and the industry averages per dimension
+_BENCH_CATS = ('Leadership', 'Process', 'People', 'Results')
+_BENCH_CURRENT = np.array([84, 76, 82, 78], dtype=np.int8)
+_BENCH_INDUSTRY = np.array([75, 70, 73, 71], dtype=np.int8)
+_BENCH_INSIGHTS = "\n\n".join([
+    "✅ **Leadership**: 9 points above industry average",
+    "✅ **People**: 9 points above industry average", 
+    "⚠️ **Process**: 6 points above, but lowest dimension",
+    "✅ **Results**: 7 points above industry average"
+])
+
+@st.cache_resource
+def _build_benchmark_fig() -> go.Figure:
+    """Bar chart of the organization's scores next to the industry averages"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        name='Your Organization', 
+        x=_BENCH_CATS, 
+        y=_BENCH_CURRENT,
+        marker_color='rgb(55, 128, 191)'
+    ))
+    fig.add_trace(go.Bar(
+        name='Industry Average', 
+        x=_BENCH_CATS, 
+        y=_BENCH_INDUSTRY,
+        marker_color='rgb(219, 64, 82)'
+    ))
+    fig.update_layout(
+        title="Benchmark Comparison",
+        yaxis_title="Score (0-100)"
+    )
+    return fig
+
+# Keyed on the scores of each upload, so the cache is bounded instead of growing per upload
+@st.cache_resource(max_entries=32)
+def _build_scores_bar_fig(dimensions: tuple, scores: tuple) -> go.Figure:
+    """Bar chart of the dimension scores of uploaded data"""
+    fig = go.Figure(go.Bar(x=list(dimensions), y=list(scores)))
+    fig.update_layout(title="Dimension Scores", xaxis_title="Dimension", yaxis_title="Score (0-100)")
+    return fig
 
 class QualityCultureDashboard:
     """Interactive dashboard with step-by-step guidance"""
     
+    # Score bands shown next to the radar chart
+    _SCORE_RANGES = {
+        "90-100": "🏆 Excellent - World class quality culture",
+        "80-89": "⭐ Very Good - Strong foundation with minor gaps",
+        "70-79": "👍 Good - Solid performance, room for improvement",
+        "60-69": "⚠️ Fair - Significant gaps need addressing",
+        "50-59": "❌ Poor - Major transformation required",
+        "<50": "🚨 Critical - Immediate action needed"
+    }
+    
+    # Demo action plan
+    _PRIORITY_ACTIONS = (
+        {
+            "priority": "🔴 High",
+            "action": "Improve Process Standardization",
+            "dimension": "Process",
+            "current_score": "76/100",
+            "target": "85/100",
+            "timeline": "3 months"
+        },
+        {
+            "priority": "🟡 Medium", 
+            "action": "Enhance Leadership Communication",
+            "dimension": "Leadership",
+            "current_score": "84/100",
+            "target": "90/100",
+            "timeline": "2 months"
+        },
+        {
+            "priority": "🟢 Low",
+            "action": "Celebrate People Engagement Success",
+            "dimension": "People", 
+            "current_score": "82/100",
+            "target": "85/100",
+            "timeline": "1 month"
+        }
+    )
+    
+    _NEXT_STEPS = """
+            **Immediate Actions (Next 30 days):**
+            1. Share results with leadership team
+            2. Identify process improvement champions
+            3. Schedule department-specific feedback sessions
+            
+            **Medium-term (1-3 months):**
+            1. Implement process standardization training
+            2. Establish regular check-ins
+            3. Create improvement action plans
+            
+            **Long-term (3-6 months):**
+            1. Re-assess to measure progress
+            2. Expand assessment to other sites
+            3. Integrate with continuous improvement
+            """
+    
     def __init__(self):
         self.frameworks = {
             "ISO10010": {
@@ -66,47 +370,10 @@ class QualityCultureDashboard:
         st.title("📊 Quality Culture Barometer")
         
         # Welcome section with clear instructions
-        with st.expander("🎯 How to Use This Dashboard", expanded=True):
-            st.markdown("""
-            ### 🚀 Quick Start Guide
-            
-            **This dashboard helps you measure and improve your organization's quality culture.**
-            
-            #### 📋 **Step-by-Step Process:**
-            
-            1. **Choose Framework** (left sidebar)
-               - **ISO 10010**: International standard with 4 dimensions
-               - **AFNOR**: French baromètre with NPQS scoring
-               - **PDA**: Pharmaceutical industry standard
-            
-            2. **Select Mode** (left sidebar)
-               - **Demo Mode**: See sample results and features
-               - **New Assessment**: Create a fresh survey
-               - **Load Data**: Upload your existing responses
-            
-            3. **Configure Assessment** (main area)
-               - Set organization details
-               - Choose demographics
-               - Customize questions
-            
-            4. **Deploy Survey**
-               - Generate survey links
-               - Send to participants
-               - Monitor responses
-            
-            5. **Analyze Results**
-               - View real-time dashboard
-               - Export reports
-               - Create action plans
-            
-            #### 🎯 **What You'll Get:**
-            - **Overall Quality Culture Score** (0-100)
-            - **Net Promoter Quality Score (NPQS)** (-100 to +100)
-            - **Maturity Level** (Initial → Optimizing)
-            - **Detailed Analysis** by department/role
-            - **Benchmark Comparisons**
-            - **Improvement Recommendations**
-            """)
+        # Open on the first run of the session only; reruns keep it folded away
+        with st.expander("🎯 How to Use This Dashboard", expanded=not st.session_state.get('help_seen')):
+            st.markdown(_HELP_MD)
+        st.session_state['help_seen'] = True
         
         # Mode-specific content
         if mode == "📊 Demo Mode":
@@ -116,6 +383,7 @@ class QualityCultureDashboard:
         else:
             self.show_load_data(selected_framework)
     
+    @_fragment
     def show_demo_mode(self, framework: str):
         """Show demo with sample data and explanations"""
         st.header("📊 Demo Mode - Sample Results")
@@ -126,6 +394,8 @@ class QualityCultureDashboard:
         
         # Generate demo data
         data = self.generate_demo_data(framework)
+        # Seeded data: no need to hash the frame on every rerun
+        st.session_state['data_fp'] = _demo_fingerprint(framework)
         
         # Key metrics with explanations
         st.markdown("### 📊 Key Performance Indicators")
@@ -144,20 +414,15 @@ class QualityCultureDashboard:
             st.metric("Completion Rate", "94.3%", 
                      help="Percentage of people who completed the full assessment")
         
-        # Detailed breakdown
-        tab1, tab2, tab3, tab4 = st.tabs(["📊 Overview", "🔍 Detailed Analysis", "🎯 Benchmark", "📋 Action Items"])
-        
-        with tab1:
-            self.show_overview_with_explanations(data, framework)
-        
-        with tab2:
-            self.show_detailed_analysis(data, framework)
-        
-        with tab3:
-            self.show_benchmark_comparison(data, framework)
-        
-        with tab4:
-            self.show_action_items(data, framework)
+        # Detailed breakdown: only the selected view is built on each rerun
+        views = {
+            "📊 Overview": self.show_overview_with_explanations,
+            "🔍 Detailed Analysis": self.show_detailed_analysis,
+            "🎯 Benchmark": self.show_benchmark_comparison,
+            "📋 Action Items": self.show_action_items
+        }
+        view = st.radio("View", list(views), horizontal=True, label_visibility="collapsed")
+        views[view](data, framework)
     
     def show_new_assessment(self, framework: str):
         """Create new assessment configuration"""
@@ -210,16 +475,19 @@ class QualityCultureDashboard:
                 }
                 
                 st.success("✅ Assessment Created Successfully!")
-                st.json(assessment_config)
+                st.code(_to_json(assessment_config), language="json")
                 
                 # Generate survey links
                 st.markdown("### 🔗 Survey Distribution")
-                survey_link = f"http://localhost:8501/survey/{org_name.lower().replace(' ', '_')}_{framework.lower()}"
+                survey_link = _survey_link(org_name, framework)
                 st.code(survey_link, language="text")
                 
                 st.markdown("**Share this link with your employees:**")
-                st.info(f"📧 **Email Template:**\n\nDear Team,\n\nWe're conducting a quality culture assessment. Please take 10-15 minutes to complete:\n\n🔗 {survey_link}\n\nYour responses are {'anonymous' if anonymity else 'confidential'} and will help us improve our quality culture.\n\nThank you!")
+                st.info(_EMAIL_TEMPLATE.substitute(
+                    link=survey_link, privacy='anonymous' if anonymity else 'confidential'
+                ))
     
+    @_fragment
     def show_load_data(self, framework: str):
         """Load existing assessment data"""
         st.header("📈 Load Existing Assessment Data")
@@ -233,14 +501,15 @@ class QualityCultureDashboard:
         if uploaded_file is not None:
             try:
                 if uploaded_file.name.endswith('.csv'):
-                    data = pd.read_csv(uploaded_file)
+                    data = _read_csv(uploaded_file)
                 elif uploaded_file.name.endswith('.xlsx'):
                     data = pd.read_excel(uploaded_file)
                 else:
                     data = pd.read_json(uploaded_file)
                 
                 st.success("✅ Data loaded successfully!")
-                st.dataframe(data.head())
+                # Preview the first rows and at most 20 columns of wide sheets
+                st.dataframe(data.iloc[:5, :20], use_container_width=True)
                 
                 # Process and display results
                 self.show_results_from_data(data, framework)
@@ -260,77 +529,50 @@ class QualityCultureDashboard:
             st.info("This chart shows your organization's strengths and improvement areas across key dimensions")
             
             dimensions = ['Leadership', 'Process', 'People', 'Results']
-            scores = [data[dim].mean() * 20 for dim in dimensions]
+            scores = np.nanmean(data[dimensions].to_numpy(dtype=np.float64), axis=0) * 20
             
-            fig = go.Figure()
-            fig.add_trace(go.Scatterpolar(
-                r=scores,
-                theta=dimensions,
-                fill='toself',
-                name='Your Score',
-                line_color='rgb(55, 128, 191)'
-            ))
-            fig.update_layout(
-                polar=dict(
-                    radialaxis=dict(range=[0, 100], tickfont_size=12),
-                    angularaxis=dict(tickfont_size=12)
-                ),
-                title="Quality Culture Dimensions",
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            fig = _build_radar_fig(tuple(scores.tolist()), tuple(dimensions))
+            st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
         
         with col2:
             st.markdown("#### 📈 Score Interpretation")
             
-            score_ranges = {
-                "90-100": "🏆 Excellent - World class quality culture",
-                "80-89": "⭐ Very Good - Strong foundation with minor gaps",
-                "70-79": "👍 Good - Solid performance, room for improvement",
-                "60-69": "⚠️ Fair - Significant gaps need addressing",
-                "50-59": "❌ Poor - Major transformation required",
-                "<50": "🚨 Critical - Immediate action needed"
-            }
-            
-            for range_text, interpretation in score_ranges.items():
-                st.write(f"**{range_text}**: {interpretation}")
+            # One markdown element instead of one per line
+            st.markdown("\n\n".join(
+                f"**{range_text}**: {interpretation}"
+                for range_text, interpretation in self._SCORE_RANGES.items()
+            ))
     
     def show_detailed_analysis(self, data: pd.DataFrame, framework: str):
         """Show detailed analysis with explanations"""
         st.markdown("### 🔍 Detailed Analysis")
         
+        fingerprint = st.session_state.get('data_fp')
+        if fingerprint is None:
+            fingerprint = _data_fingerprint(data)
+        
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("#### 📊 Department Comparison")
             st.info("Compare quality culture scores across different departments")
             
-            dept_scores = data.groupby('department')[['Leadership', 'Process', 'People', 'Results']].mean() * 20
-            
-            fig = px.bar(
-                dept_scores.reset_index().melt(id_vars='department'),
-                x='department',
-                y='value',
-                color='variable',
-                title="Scores by Department",
-                labels={'value': 'Score (0-100)', 'variable': 'Dimension'}
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            fig = _build_dept_bar_fig(fingerprint, data)
+            st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
         
         with col2:
             st.markdown("#### 📈 Distribution Analysis")
             st.info("See how scores are distributed across your organization")
             
-            selected_dim = st.selectbox("Select Dimension", ['Leadership', 'Process', 'People', 'Results'])
-            
-            fig = px.histogram(
-                data, 
-                x=selected_dim * 20,
-                nbins=20,
-                title=f"{selected_dim} Score Distribution",
-                labels={'x': 'Score (0-100)'}
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            self._show_distribution(data, fingerprint)
+    
+    @_fragment
+    def _show_distribution(self, data: pd.DataFrame, fingerprint: int):
+        """Dimension selector and histogram, rerun on their own when the dimension changes"""
+        selected_dim = st.selectbox("Select Dimension", ['Leadership', 'Process', 'People', 'Results'])
+        
+        fig = _build_hist_fig(fingerprint, selected_dim, data)
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
     
     def show_benchmark_comparison(self, data: pd.DataFrame, framework: str):
         """Show benchmark with explanations"""
@@ -342,41 +584,13 @@ class QualityCultureDashboard:
             st.markdown("#### 📊 Industry Comparison")
             st.info("Compare your organization's performance against industry standards")
             
-            categories = ['Leadership', 'Process', 'People', 'Results']
-            current = [84, 76, 82, 78]
-            industry = [75, 70, 73, 71]
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                name='Your Organization', 
-                x=categories, 
-                y=current,
-                marker_color='rgb(55, 128, 191)'
-            ))
-            fig.add_trace(go.Bar(
-                name='Industry Average', 
-                x=categories, 
-                y=industry,
-                marker_color='rgb(219, 64, 82)'
-            ))
-            fig.update_layout(
-                title="Benchmark Comparison",
-                yaxis_title="Score (0-100)"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            fig = _build_benchmark_fig()
+            st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
         
         with col2:
             st.markdown("#### 🎯 Benchmark Insights")
             
-            insights = [
-                "✅ **Leadership**: 9 points above industry average",
-                "✅ **People**: 9 points above industry average", 
-                "⚠️ **Process**: 6 points above, but lowest dimension",
-                "✅ **Results**: 7 points above industry average"
-            ]
-            
-            for insight in insights:
-                st.write(insight)
+            st.markdown(_BENCH_INSIGHTS)
     
     def show_action_items(self, data: pd.DataFrame, framework: str):
         """Show actionable recommendations"""
@@ -387,34 +601,7 @@ class QualityCultureDashboard:
         with col1:
             st.markdown("#### 🎯 Priority Actions")
             
-            actions = [
-                {
-                    "priority": "🔴 High",
-                    "action": "Improve Process Standardization",
-                    "dimension": "Process",
-                    "current_score": "76/100",
-                    "target": "85/100",
-                    "timeline": "3 months"
-                },
-                {
-                    "priority": "🟡 Medium", 
-                    "action": "Enhance Leadership Communication",
-                    "dimension": "Leadership",
-                    "current_score": "84/100",
-                    "target": "90/100",
-                    "timeline": "2 months"
-                },
-                {
-                    "priority": "🟢 Low",
-                    "action": "Celebrate People Engagement Success",
-                    "dimension": "People", 
-                    "current_score": "82/100",
-                    "target": "85/100",
-                    "timeline": "1 month"
-                }
-            ]
-            
-            for action in actions:
+            for action in self._PRIORITY_ACTIONS:
                 with st.expander(f"{action['priority']} - {action['action']}"):
                     st.write(f"**Dimension:** {action['dimension']}")
                     st.write(f"**Current Score:** {action['current_score']}")
@@ -424,58 +611,11 @@ class QualityCultureDashboard:
         with col2:
             st.markdown("#### 📊 Next Steps")
             
-            st.info("""
-            **Immediate Actions (Next 30 days):**
-            1. Share results with leadership team
-            2. Identify process improvement champions
-            3. Schedule department-specific feedback sessions
-            
-            **Medium-term (1-3 months):**
-            1. Implement process standardization training
-            2. Establish regular check-ins
-            3. Create improvement action plans
-            
-            **Long-term (3-6 months):**
-            1. Re-assess to measure progress
-            2. Expand assessment to other sites
-            3. Integrate with continuous improvement
-            """)
+            st.info(self._NEXT_STEPS)
     
     def generate_demo_data(self, framework: str) -> pd.DataFrame:
         """Generate realistic demo data"""
-        np.random.seed(42)
-        n = 500
-        
-        if framework == "ISO10010":
-            data = {
-                'Leadership': np.random.normal(4.2, 0.6, n),
-                'Process': np.random.normal(3.8, 0.7, n),
-                'People': np.random.normal(4.1, 0.5, n),
-                'Results': np.random.normal(3.9, 0.8, n),
-            }
-        elif framework == "AFNOR":
-            data = {
-                'Responsibility': np.random.normal(4.0, 0.5, n),
-                'First_Time_Right': np.random.normal(3.7, 0.6, n),
-                'Problem_Reporting': np.random.normal(4.2, 0.5, n),
-                'Continuous_Improvement': np.random.normal(3.9, 0.7, n),
-            }
-        else:  # PDA
-            data = {
-                'Leadership_Commitment': np.random.normal(4.1, 0.5, n),
-                'Quality_Systems': np.random.normal(3.9, 0.6, n),
-                'Risk_Management': np.random.normal(4.0, 0.5, n),
-                'Training_Competency': np.random.normal(3.8, 0.7, n),
-            }
-        
-        data.update({
-            'department': np.random.choice(['Production', 'R&D', 'Sales', 'Quality', 'Operations'], n),
-            'site': np.random.choice(['Site A', 'Site B', 'Site C', 'Remote'], n),
-            'role_level': np.random.choice(['Individual', 'Team Lead', 'Manager', 'Executive'], n),
-            'experience': np.random.choice(['<1yr', '1-3yrs', '3-5yrs', '5-10yrs', '>10yrs'], n)
-        })
-        
-        return pd.DataFrame(data)
+        return _generate_demo_data(framework)
     
     def show_results_from_data(self, data: pd.DataFrame, framework: str):
         """Display results from uploaded data"""
@@ -499,13 +639,8 @@ class QualityCultureDashboard:
         st.dataframe(scores.to_frame('Score').T)
         
         # Visualizations
-        fig = px.bar(
-            x=dimensions,
-            y=scores.values,
-            title="Dimension Scores",
-            labels={'x': 'Dimension', 'y': 'Score (0-100)'}
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        fig = _build_scores_bar_fig(tuple(dimensions), tuple(scores.tolist()))
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
 
 if __name__ == "__main__":
     dashboard = QualityCultureDashboard()
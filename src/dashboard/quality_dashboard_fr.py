@@ -6,14 +6,234 @@ Dashboard interactif avec explications claires en français
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
+import io
 import json
+import functools
+from typing import TYPE_CHECKING
+
+# plotly est importé dans les méthodes qui dessinent : la page Nouvelle Évaluation
+# n'a aucun graphique et n'en paie pas le chargement au démarrage
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+try:
+    import orjson
+except ImportError:  # orjson est optionnel, repli sur le lecteur pandas
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow est optionnel, repli sur le lecteur pandas
+    pacsv = None
+
+# Barre d'outils sans le logo ni les outils de sélection qu'aucun graphique n'utilise
+_CONFIG_PLOTLY = {
+    'displaylogo': False,
+    'modeBarButtonsToRemove': ['lasso2d', 'select2d', 'autoScale2d']
+}
+
+# Colonnes démographiques (tout le reste est traité comme une dimension)
+_DEMOGRAPHIES = ('department', 'site', 'role_level', 'experience')
+
+def _demographies_en_categories(donnees: pd.DataFrame) -> pd.DataFrame:
+    """Convertir les colonnes démographiques présentes en Categorical (codes entiers au lieu d'objets)"""
+    for colonne in _DEMOGRAPHIES:
+        if colonne in donnees.columns:
+            donnees[colonne] = donnees[colonne].astype('category')
+    return donnees
+
+@st.cache_data(ttl=3600)
+def _generer_donnees_demo(cadre: str) -> pd.DataFrame:
+    """Générer des données de démo réalistes (graine fixe, donc mises en cache par cadre)"""
+    # Tous les tirages viennent d'un seul générateur PCG64 à graine fixe
+    rng = np.random.default_rng(42)
+    n = 500
+    
+    if cadre == "ISO10010":
+        dimensions = ['Leadership', 'Processus', 'Personnes', 'Résultats']
+        moyennes, ecarts = [4.2, 3.8, 4.1, 3.9], [0.6, 0.7, 0.5, 0.8]
+    elif cadre == "AFNOR":
+        dimensions = ['Responsabilité', 'Qualité dès la 1ère fois', 'Remontée problèmes', 'Amélioration continue']
+        moyennes, ecarts = [4.0, 3.7, 4.2, 3.9], [0.5, 0.6, 0.5, 0.7]
+    else:  # PDA
+        dimensions = ['Engagement Leadership', 'Systèmes Qualité', 'Gestion Risques', 'Formation Compétences']
+        moyennes, ecarts = [4.1, 3.9, 4.0, 3.8], [0.5, 0.6, 0.5, 0.7]
+    
+    # Toutes les dimensions en un seul tirage (n, 4)
+    scores = rng.normal(loc=moyennes, scale=ecarts, size=(n, len(dimensions)))
+    donnees = dict(zip(dimensions, scores.T))
+    
+    donnees.update({
+        'department': rng.choice(['Production', 'R&D', 'Ventes', 'Qualité', 'Opérations'], n),
+        'site': rng.choice(['Site A', 'Site B', 'Site C', 'Télétravail'], n),
+        'role_level': rng.choice(['Individuel', 'Chef d\'Équipe', 'Manager', 'Direction'], n),
+        'experience': rng.choice(['<1an', '1-3ans', '3-5ans', '5-10ans', '>10ans'], n)
+    })
+    
+    return _demographies_en_categories(pd.DataFrame(donnees))
+
+def _empreinte(donnees: pd.DataFrame) -> int:
+    """
+    Empreinte du contenu complet d'un DataFrame, utilisée comme clé des caches calculés dessus
+    
+    Les noms de colonnes sont inclus : deux fichiers aux valeurs identiques mais aux
+    colonnes différentes ne doivent pas partager leurs scores.
+    """
+    contenu = int(pd.util.hash_pandas_object(donnees, index=False).to_numpy().sum())
+    return hash((contenu, donnees.shape, tuple(donnees.columns)))
+
+def _scores_dimensions(donnees: pd.DataFrame, dimensions: tuple) -> np.ndarray:
+    """
+    Score moyen (0-100) de chaque dimension, en une seule réduction par colonne
+    
+    Non mis en cache : une moyenne par colonne coûte moins que le hachage de la clé.
+    """
+    return donnees.loc[:, list(dimensions)].mean(axis=0).to_numpy() * 20
+
+# Les caches ci-dessous sont indexés par l'empreinte ; le tiret bas initial de _donnees
+# empêche Streamlit de hacher le DataFrame complet à chaque appel
+@st.cache_data
+def _scores_departements(empreinte: int, _donnees: pd.DataFrame, dimensions: tuple) -> pd.DataFrame:
+    """Score moyen (0-100) de chaque dimension par département"""
+    return _donnees.groupby('department', observed=True)[list(dimensions)].mean() * 20
+
+@st.cache_data
+def _histogramme(empreinte: int, _donnees: pd.DataFrame, dimension: str, nbins: int = 20) -> tuple:
+    """
+    Effectifs et bornes des classes d'une dimension, calculés côté serveur
+    
+    Les réponses entières sur une échelle courte (Likert 0-10) sont comptées avec
+    np.bincount, une classe par valeur ; le reste passe par np.histogram.
+    """
+    colonne = _donnees[dimension]
+    if pd.api.types.is_integer_dtype(colonne.dtype) and len(colonne) and not colonne.hasnans:
+        valeurs = colonne.to_numpy(dtype=np.int64)
+        minimum = valeurs.min()
+        if 0 <= minimum and valeurs.max() <= 10:
+            effectifs = np.bincount(valeurs - minimum)
+            # Classes centrées sur chaque valeur entière, à partir de la plus petite observée
+            return effectifs, np.arange(len(effectifs) + 1) + minimum - 0.5
+    valeurs = colonne.to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.histogram(valeurs[~np.isnan(valeurs)], bins=nbins)
+
+def _lire_csv(fichier) -> pd.DataFrame:
+    """Lire un CSV téléchargé, avec le lecteur multi-thread de pyarrow s'il est disponible"""
+    if pacsv is None:
+        return pd.read_csv(fichier)
+    # Les colonnes texte restent en Arrow au lieu d'un objet Python par cellule
+    type_texte = pd.ArrowDtype(pa.string())
+    return pacsv.read_csv(fichier).to_pandas(
+        types_mapper=lambda type_arrow: type_texte if type_arrow == pa.string() else None
+    )
+
+def _lire_json(fichier) -> pd.DataFrame:
+    """Lire un JSON téléchargé (liste d'enregistrements ou colonnes), avec orjson s'il est disponible"""
+    if orjson is None:
+        return pd.read_json(fichier)
+    return pd.DataFrame(orjson.loads(fichier.read()))
+
+@st.cache_data
+def _radar_png(dimensions: tuple, scores: tuple) -> bytes:
+    """
+    Radar des scores (0-100) rendu en PNG statique par matplotlib (Agg)
+    
+    Quatre points ne justifient pas le chargement de Plotly côté navigateur.
+    """
+    from matplotlib.figure import Figure
+    
+    angles = np.linspace(0, 2 * np.pi, len(dimensions), endpoint=False)
+    # Polygone fermé : le premier point est répété à la fin
+    angles_fermes = np.append(angles, angles[0])
+    scores_fermes = np.append(scores, scores[0])
+    
+    fig = Figure(figsize=(6, 4), dpi=100)
+    ax = fig.add_subplot(projection='polar')
+    ax.plot(angles_fermes, scores_fermes, color='#3780bf', linewidth=2, label='Votre Score')
+    ax.fill(angles_fermes, scores_fermes, color='#3780bf', alpha=0.25)
+    ax.set_xticks(angles)
+    ax.set_xticklabels(dimensions, fontsize=9)
+    ax.set_ylim(0, 100)
+    ax.set_title("Dimensions de la Culture Qualité")
+    
+    tampon = io.BytesIO()
+    fig.savefig(tampon, format='png', dpi=100, bbox_inches='tight')
+    return tampon.getvalue()
+
+def _mise_en_page(titre: str, **axes) -> dict:
+    """Mise en page commune des graphiques : titre, marges serrées et hauteur fixe"""
+    return dict(title=titre, margin=dict(l=20, r=20, t=40, b=20), height=400, **axes)
+
+def _figure_session(cle: tuple, construire) -> "go.Figure":
+    """Figure mémorisée dans la session, construite seulement au premier affichage de sa clé"""
+    figures = st.session_state.setdefault('figures', {})
+    if cle not in figures:
+        figures[cle] = construire()
+    return figures[cle]
+
+# Guide de démarrage affiché en haut de chaque page
+_GUIDE_MD = """
+            ### 🚀 Guide de Démarrage Rapide
+            
+            **Ce tableau de bord vous aide à mesurer et améliorer la culture qualité de votre organisation.**
+            
+            #### 📋 **Processus Étape par Étape :**
+            
+            1. **Choisir le Cadre** (barre latérale gauche)
+               - **ISO 10010** : Norme internationale avec 4 dimensions
+               - **AFNOR** : Baromètre français avec score NPQS
+               - **PDA** : Standard industriel pharmaceutique
+            
+            2. **Sélectionner le Mode** (barre latérale gauche)
+               - **Mode Démo** : Voir des exemples de résultats et fonctionnalités
+               - **Nouvelle Évaluation** : Créer une nouvelle enquête
+               - **Charger Données** : Importer vos réponses existantes
+            
+            3. **Configurer l'Évaluation** (zone principale)
+               - Définir les détails de l'organisation
+               - Choisir les démographies
+               - Personnaliser les questions
+            
+            4. **Déployer l'Enquête**
+               - Générer des liens d'enquête
+               - Envoyer aux participants
+               - Suivre les réponses
+            
+            5. **Analyser les Résultats**
+               - Voir le tableau de bord en temps réel
+               - Exporter les rapports
+               - Créer des plans d'action
+            
+            #### 🎯 **Ce que vous obtiendrez :**
+            - **Score Global Culture Qualité** (0-100)
+            - **Score NPQS** (-100 à +100)
+            - **Niveau de Maturité** (Initial → Optimisation)
+            - **Analyse Détaillée** par département/rôle
+            - **Comparatifs de Référence**
+            - **Recommandations d'Amélioration**
+            """
+
+# Interprétation des scores, en un seul bloc markdown (un élément au lieu de six)
+_GAMMES_SCORES_MD = "\n\n".join([
+    "**90-100**: 🏆 Excellent - Culture qualité de classe mondiale",
+    "**80-89**: ⭐ Très Bon - Fondation solide avec des améliorations mineures",
+    "**70-79**: 👍 Bon - Performance solide, place pour l'amélioration",
+    "**60-69**: ⚠️ Moyen - Lacunes significatives à adresser",
+    "**50-59**: ❌ Faible - Transformation majeure requise",
+    "**<50**: 🚨 Critique - Action immédiate nécessaire"
+])
 
 class TableauBordCultureQualite:
     """Dashboard interactif en français avec guide étape par étape"""
     
+    # Dimensions évaluées par chaque cadre
+    DIMENSIONS = {
+        "ISO10010": ('Leadership', 'Processus', 'Personnes', 'Résultats'),
+        "AFNOR": ('Responsabilité', 'Qualité dès la 1ère fois', 'Remontée problèmes', 'Amélioration continue'),
+        "PDA": ('Engagement Leadership', 'Systèmes Qualité', 'Gestion Risques', 'Formation Compétences'),
+    }
+    
     def __init__(self):
         self.cadres = {
             "ISO10010": {
@@ -67,46 +287,7 @@ class TableauBordCultureQualite:
         
         # Guide d'utilisation
         with st.expander("🎯 Guide d'utilisation", expanded=True):
-            st.markdown("""
-            ### 🚀 Guide de Démarrage Rapide
-            
-            **Ce tableau de bord vous aide à mesurer et améliorer la culture qualité de votre organisation.**
-            
-            #### 📋 **Processus Étape par Étape :**
-            
-            1. **Choisir le Cadre** (barre latérale gauche)
-               - **ISO 10010** : Norme internationale avec 4 dimensions
-               - **AFNOR** : Baromètre français avec score NPQS
-               - **PDA** : Standard industriel pharmaceutique
-            
-            2. **Sélectionner le Mode** (barre latérale gauche)
-               - **Mode Démo** : Voir des exemples de résultats et fonctionnalités
-               - **Nouvelle Évaluation** : Créer une nouvelle enquête
-               - **Charger Données** : Importer vos réponses existantes
-            
-            3. **Configurer l'Évaluation** (zone principale)
-               - Définir les détails de l'organisation
-               - Choisir les démographies
-               - Personnaliser les questions
-            
-            4. **Déployer l'Enquête**
-               - Générer des liens d'enquête
-               - Envoyer aux participants
-               - Suivre les réponses
-            
-            5. **Analyser les Résultats**
-               - Voir le tableau de bord en temps réel
-               - Exporter les rapports
-               - Créer des plans d'action
-            
-            #### 🎯 **Ce que vous obtiendrez :**
-            - **Score Global Culture Qualité** (0-100)
-            - **Score NPQS** (-100 à +100)
-            - **Niveau de Maturité** (Initial → Optimisation)
-            - **Analyse Détaillée** par département/rôle
-            - **Comparatifs de Référence**
-            - **Recommandations d'Amélioration**
-            """)
+            st.markdown(_GUIDE_MD)
         
         # Contenu spécifique au mode
         if mode == "📊 Mode Démo":
@@ -212,9 +393,11 @@ class TableauBordCultureQualite:
                 st.success("✅ Évaluation Créée avec Succès!")
                 st.json(config_evaluation)
                 
-                # Générer des liens d'enquête
+                # Générer des liens d'enquête ; le st.form ne relance le script qu'à la
+                # soumission, l'identifiant est donc calculé une seule fois par évaluation
                 st.markdown("### 🔗 Distribution de l'Enquête")
-                lien_enquete = f"http://localhost:8501/enquete/{nom_org.lower().replace(' ', '_')}_{cadre.lower()}"
+                identifiant = f"{nom_org.lower().replace(' ', '_')}_{cadre.lower()}"
+                lien_enquete = f"http://localhost:8501/enquete/{identifiant}"
                 st.code(lien_enquete, language="text")
                 
                 st.markdown("**Partager ce lien avec vos employés :**")
@@ -233,14 +416,16 @@ class TableauBordCultureQualite:
         if fichier_telecharge is not None:
             try:
                 if fichier_telecharge.name.endswith('.csv'):
-                    donnees = pd.read_csv(fichier_telecharge)
+                    donnees = _lire_csv(fichier_telecharge)
                 elif fichier_telecharge.name.endswith('.xlsx'):
                     donnees = pd.read_excel(fichier_telecharge)
                 else:
-                    donnees = pd.read_json(fichier_telecharge)
+                    donnees = _lire_json(fichier_telecharge)
+                donnees = _demographies_en_categories(donnees)
                 
                 st.success("✅ Données chargées avec succès!")
-                st.dataframe(donnees.head())
+                # Aperçu limité à 5 lignes et 20 colonnes : le coût Arrow suit le nombre de colonnes
+                st.dataframe(donnees.iloc[:5, :20], use_container_width=True)
                 
                 # Traiter et afficher les résultats
                 self.afficher_resultats_donnees(donnees, cadre)
@@ -259,51 +444,24 @@ class TableauBordCultureQualite:
             st.markdown("#### 🎯 Explication du Graphique Radar")
             st.info("Ce graphique montre les forces et domaines d'amélioration de votre organisation")
             
-            if cadre == "ISO10010":
-                dimensions = ['Leadership', 'Processus', 'Personnes', 'Résultats']
-            elif cadre == "AFNOR":
-                dimensions = ['Responsabilité', 'Qualité dès la 1ère fois', 'Remontée problèmes', 'Amélioration continue']
-            else:  # PDA
-                dimensions = ['Engagement Leadership', 'Systèmes Qualité', 'Gestion Risques', 'Formation Compétences']
-            
-            scores = [donnees[dim].mean() * 20 for dim in dimensions]
-            
-            fig = go.Figure()
-            fig.add_trace(go.Scatterpolar(
-                r=scores,
-                theta=dimensions,
-                fill='toself',
-                name='Votre Score',
-                line_color='rgb(55, 128, 191)'
-            ))
-            fig.update_layout(
-                polar=dict(
-                    radialaxis=dict(range=[0, 100], tickfont_size=12),
-                    angularaxis=dict(tickfont_size=12)
-                ),
-                title="Dimensions de la Culture Qualité",
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            dimensions = self.DIMENSIONS[cadre]
+            
+            scores = _scores_dimensions(donnees, dimensions)
+            st.image(_radar_png(dimensions, tuple(scores.tolist())))
         
         with col2:
             st.markdown("#### 📈 Interprétation des Scores")
             
-            gammes_scores = {
-                "90-100": "🏆 Excellent - Culture qualité de classe mondiale",
-                "80-89": "⭐ Très Bon - Fondation solide avec des améliorations mineures",
-                "70-79": "👍 Bon - Performance solide, place pour l'amélioration",
-                "60-69": "⚠️ Moyen - Lacunes significatives à adresser",
-                "50-59": "❌ Faible - Transformation majeure requise",
-                "<50": "🚨 Critique - Action immédiate nécessaire"
-            }
-            
-            for gamme, interpretation in gammes_scores.items():
-                st.write(f"**{gamme}**: {interpretation}")
+            st.markdown(_GAMMES_SCORES_MD)
     
     def afficher_analyse_detaillee(self, donnees: pd.DataFrame, cadre: str):
         """Afficher l'analyse détaillée avec explications"""
+        import plotly.express as px
+        import plotly.graph_objects as go
         st.markdown("### 🔍 Analyse Détaillée")
+        dimensions = self.DIMENSIONS[cadre]
+        # Hachée au plus une fois par exécution, et seulement si une figure manque dans la session
+        empreinte = functools.cache(lambda: _empreinte(donnees))
         
         col1, col2 = st.columns(2)
         
@@ -311,49 +469,54 @@ class TableauBordCultureQualite:
             st.markdown("#### 📊 Comparaison par Département")
             st.info("Comparer les scores de culture qualité entre différents départements")
             
-            if cadre == "ISO10010":
-                dimensions = ['Leadership', 'Processus', 'Personnes', 'Résultats']
-            elif cadre == "AFNOR":
-                dimensions = ['Responsabilité', 'Qualité dès la 1ère fois', 'Remontée problèmes', 'Amélioration continue']
-            else:  # PDA
-                dimensions = ['Engagement Leadership', 'Systèmes Qualité', 'Gestion Risques', 'Formation Compétences']
-            
-            dept_scores = donnees.groupby('department')[dimensions].mean() * 20
-            
-            fig = px.bar(
-                dept_scores.reset_index().melt(id_vars='department'),
-                x='department',
-                y='value',
-                color='variable',
-                title="Scores par Département",
-                labels={'value': 'Score (0-100)', 'variable': 'Dimension'}
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            def construire_departements():
+                dept_scores = _scores_departements(empreinte(), donnees, dimensions)
+            
+                # Format long construit directement depuis le tableau large (sans reset_index/melt)
+                departements = dept_scores.index.to_numpy()
+                valeurs = dept_scores.to_numpy()
+                scores_long = pd.DataFrame({
+                    'department': np.repeat(departements, valeurs.shape[1]),
+                    'variable': np.tile(dept_scores.columns.to_numpy(), len(departements)),
+                    'value': valeurs.ravel()
+                })
+            
+                fig = px.bar(
+                    scores_long,
+                    x='department',
+                    y='value',
+                    color='variable',
+                    labels={'value': 'Score (0-100)', 'variable': 'Dimension'}
+                )
+                fig.update_layout(**_mise_en_page("Scores par Département"))
+                return fig
+            
+            fig = _figure_session(('departements', cadre), construire_departements)
+            st.plotly_chart(fig, use_container_width=True, config=_CONFIG_PLOTLY)
         
         with col2:
             st.markdown("#### 📈 Distribution des Scores")
             st.info("Voir comment les scores sont répartis dans votre organisation")
             
-            if cadre == "ISO10010":
-                dimensions = ['Leadership', 'Processus', 'Personnes', 'Résultats']
-            elif cadre == "AFNOR":
-                dimensions = ['Responsabilité', 'Qualité dès la 1ère fois', 'Remontée problèmes', 'Amélioration continue']
-            else:  # PDA
-                dimensions = ['Engagement Leadership', 'Systèmes Qualité', 'Gestion Risques', 'Formation Compétences']
-            
             dim_selectionnee = st.selectbox("Sélectionner la Dimension", dimensions)
             
-            fig = px.histogram(
-                donnees, 
-                x=dim_selectionnee,
-                nbins=20,
-                title=f"Distribution des Scores - {dim_selectionnee}",
-                labels={'x': 'Score (0-100)'}
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            def construire_distribution():
+                # Seuls les effectifs des classes partent vers le navigateur, pas les valeurs brutes
+                effectifs, bornes = _histogramme(empreinte(), donnees, dim_selectionnee)
+                fig = go.Figure(go.Bar(x=(bornes[:-1] + bornes[1:]) / 2, y=effectifs, width=np.diff(bornes)))
+                fig.update_layout(**_mise_en_page(
+                    f"Distribution des Scores - {dim_selectionnee}",
+                    xaxis_title=dim_selectionnee,
+                    yaxis_title="count"
+                ))
+                return fig
+            
+            fig = _figure_session(('distribution', cadre, dim_selectionnee), construire_distribution)
+            st.plotly_chart(fig, use_container_width=True, config=_CONFIG_PLOTLY)
     
     def afficher_comparaison_referentiel(self, donnees: pd.DataFrame, cadre: str):
         """Afficher la comparaison avec le référentiel"""
+        import plotly.graph_objects as go
         st.markdown("### 🎯 Comparaison avec le Référentiel")
         
         col1, col2 = st.columns([2, 1])
@@ -362,34 +525,30 @@ class TableauBordCultureQualite:
             st.markdown("#### 📊 Comparaison Industrielle")
             st.info("Comparer la performance de votre organisation avec les standards de l'industrie")
             
-            if cadre == "ISO10010":
-                categories = ['Leadership', 'Processus', 'Personnes', 'Résultats']
-            elif cadre == "AFNOR":
-                categories = ['Responsabilité', 'Qualité dès la 1ère fois', 'Remontée problèmes', 'Amélioration continue']
-            else:  # PDA
-                categories = ['Engagement Leadership', 'Systèmes Qualité', 'Gestion Risques', 'Formation Compétences']
-            
-            actuel = [84, 76, 82, 78]
-            industrie = [75, 70, 73, 71]
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                name='Votre Organisation', 
-                x=categories, 
-                y=actuel,
-                marker_color='rgb(55, 128, 191)'
-            ))
-            fig.add_trace(go.Bar(
-                name='Moyenne Industrie', 
-                x=categories, 
-                y=industrie,
-                marker_color='rgb(219, 64, 82)'
-            ))
-            fig.update_layout(
-                title="Comparaison avec le Référentiel",
-                yaxis_title="Score (0-100)"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            categories = self.DIMENSIONS[cadre]
+            
+            def construire_referentiel():
+                actuel = [84, 76, 82, 78]
+                industrie = [75, 70, 73, 71]
+            
+                fig = go.Figure()
+                fig.add_trace(go.Bar(
+                    name='Votre Organisation', 
+                    x=categories, 
+                    y=actuel,
+                    marker_color='rgb(55, 128, 191)'
+                ))
+                fig.add_trace(go.Bar(
+                    name='Moyenne Industrie', 
+                    x=categories, 
+                    y=industrie,
+                    marker_color='rgb(219, 64, 82)'
+                ))
+                fig.update_layout(**_mise_en_page("Comparaison avec le Référentiel", yaxis_title="Score (0-100)"))
+                return fig
+            
+            fig = _figure_session(('referentiel', cadre), construire_referentiel)
+            st.plotly_chart(fig, use_container_width=True, config=_CONFIG_PLOTLY)
         
         with col2:
             st.markdown("#### 🎯 Insights du Référentiel")
@@ -469,53 +628,22 @@ class TableauBordCultureQualite:
     
     def generer_donnees_demo(self, cadre: str) -> pd.DataFrame:
         """Générer des données de démo réalistes"""
-        np.random.seed(42)
-        n = 500
-        
-        if cadre == "ISO10010":
-            donnees = {
-                'Leadership': np.random.normal(4.2, 0.6, n),
-                'Processus': np.random.normal(3.8, 0.7, n),
-                'Personnes': np.random.normal(4.1, 0.5, n),
-                'Résultats': np.random.normal(3.9, 0.8, n),
-            }
-        elif cadre == "AFNOR":
-            donnees = {
-                'Responsabilité': np.random.normal(4.0, 0.5, n),
-                'Qualité dès la 1ère fois': np.random.normal(3.7, 0.6, n),
-                'Remontée problèmes': np.random.normal(4.2, 0.5, n),
-                'Amélioration continue': np.random.normal(3.9, 0.7, n),
-            }
-        else:  # PDA
-            donnees = {
-                'Engagement Leadership': np.random.normal(4.1, 0.5, n),
-                'Systèmes Qualité': np.random.normal(3.9, 0.6, n),
-                'Gestion Risques': np.random.normal(4.0, 0.5, n),
-                'Formation Compétences': np.random.normal(3.8, 0.7, n),
-            }
-        
-        donnees.update({
-            'department': np.random.choice(['Production', 'R&D', 'Ventes', 'Qualité', 'Opérations'], n),
-            'site': np.random.choice(['Site A', 'Site B', 'Site C', 'Télétravail'], n),
-            'role_level': np.random.choice(['Individuel', 'Chef d\'Équipe', 'Manager', 'Direction'], n),
-            'experience': np.random.choice(['<1an', '1-3ans', '3-5ans', '5-10ans', '>10ans'], n)
-        })
-        
-        return pd.DataFrame(donnees)
+        return _generer_donnees_demo(cadre)
     
     def afficher_resultats_donnees(self, donnees: pd.DataFrame, cadre: str):
         """Afficher les résultats à partir des données téléchargées"""
+        import plotly.express as px
         st.success("✅ Données traitées avec succès!")
         
         # Calculer les scores
-        dimensions = [col for col in donnees.columns if col not in ['department', 'site', 'role_level', 'experience']]
-        scores = donnees[dimensions].mean() * 20
+        dimensions = [col for col in donnees.columns if col not in _DEMOGRAPHIES]
+        scores = _scores_dimensions(donnees, tuple(dimensions))
         
         st.markdown("### 📊 Résumé des Résultats")
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.metric("Score Global", f"{scores.mean():.1f}/100")
+            st.metric("Score Global", f"{np.nanmean(scores):.1f}/100")
         with col2:
             st.metric("Réponses Totales", len(donnees))
         with col3:
@@ -524,11 +652,11 @@ class TableauBordCultureQualite:
         # Visualisations
         fig = px.bar(
             x=dimensions,
-            y=scores.values,
-            title="Scores par Dimension",
+            y=scores,
             labels={'x': 'Dimension', 'y': 'Score (0-100)'}
         )
-        st.plotly_chart(fig, use_container_width=True)
+        fig.update_layout(**_mise_en_page("Scores par Dimension"))
+        st.plotly_chart(fig, use_container_width=True, config=_CONFIG_PLOTLY)
 
 if __name__ == "__main__":
     tableau_bord = TableauBordCultureQualite()
@@ -3,88 +3,264 @@ Pharmaceutical Sector Quality Culture Assessment
 Based on PDA Quality Culture Assessment Tool and FDA QMM requirements
 """
 
-from typing import Dict, List, Optional
+import sys
+from typing import TYPE_CHECKING, ClassVar, Dict, List, Mapping, Optional, Tuple
+from types import MappingProxyType
 from dataclasses import dataclass
-import pandas as pd
 import numpy as np
 
-@dataclass
+# pandas is imported where a DataFrame is built; callers that score responses
+# already have it loaded, and the domain tables and reports do not need it
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, fall back to the NumPy reduction
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _domain_means(X, starts, stops):
+        """
+        Average of the NaN-skipping item means of each domain, in one pass over the
+        responses (domains in parallel)
+        
+        Args:
+            X: Responses, shape (n_respondents, n_items), ideally column-major
+            starts, stops: Column offsets of each domain's items
+        """
+        n = X.shape[0]
+        out = np.empty(starts.size)
+        for d in prange(starts.size):
+            total = 0.0
+            answered = 0.0
+            for j in range(starts[d], stops[d]):
+                count = 0.0
+                item_total = 0.0
+                for i in range(n):
+                    value = X[i, j]
+                    if not np.isnan(value):
+                        count += 1.0
+                        item_total += value
+                # Items nobody answered are left out of the domain average, as in pandas
+                if count > 0.0:
+                    total += item_total / count
+                    answered += 1.0
+            out[d] = total / answered if answered > 0.0 else np.nan
+        return out
+    # Compiled (or loaded from the on-disk cache) on the first scoring call, not at import
+else:
+    _domain_means = None
+
+def _slice_nanmeans(means: np.ndarray, starts: np.ndarray, axis: int = 0) -> np.ndarray:
+    """
+    Mean of each contiguous slice of item means, skipping NaN item means (items with no
+    answers) the way pandas' mean() does; a slice with no finite mean is NaN
+    """
+    answered = ~np.isnan(means)
+    totals = np.add.reduceat(np.where(answered, means, 0.0), starts, axis=axis)
+    counts = np.add.reduceat(answered, starts, axis=axis)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return totals / counts
+
+def _intern_domains(domains: Dict[str, List[str]]) -> Mapping[str, Tuple[str, ...]]:
+    """
+    Read-only domain table with interned labels, so every assessment instance shares
+    one string object per label and comparisons between them short-circuit on identity
+    """
+    return MappingProxyType({
+        sys.intern(domain): tuple(sys.intern(item) for item in items) for domain, items in domains.items()
+    })
+
+@dataclass(frozen=True, slots=True)
 class PharmaAssessmentConfig:
     """Configuration for pharmaceutical sector assessment"""
     regulatory_framework: str = "FDA QMM"
     maturity_levels: int = 5
     assessment_type: str = "Combined Audit + Survey"
     
+# PDA pharmaceutical domains and their items
+_PHARMA_DOMAINS = _intern_domains({
+    "Leadership": [
+        "Executive commitment to quality",
+        "Quality vision communication",
+        "Resource allocation for quality",
+        "Quality in strategic planning"
+    ],
+    "Communication": [
+        "Open communication channels",
+        "Quality message clarity",
+        "Cross-functional collaboration",
+        "Escalation processes"
+    ],
+    "Ownership": [
+        "Individual accountability",
+        "Team responsibility",
+        "Quality ownership culture",
+        "Proactive behavior"
+    ],
+    "Continuous Improvement": [
+        "Learning from mistakes",
+        "Process improvement initiatives",
+        "Innovation encouragement",
+        "Best practice sharing"
+    ],
+    "Technical Excellence": [
+        "Scientific rigor",
+        "Technical competency",
+        "Quality systems knowledge",
+        "Risk-based thinking"
+    ]
+})
+
+# NACCHO QI SAT 2.0 healthcare domains and their items
+_HEALTHCARE_DOMAINS = _intern_domains({
+    "Leadership Commitment": [
+        "Executive leadership involvement",
+        "Quality as strategic priority",
+        "Resource allocation"
+    ],
+    "Customer Focus": [
+        "Patient-centered care",
+        "Community engagement",
+        "Service quality"
+    ],
+    "Process Management": [
+        "Standardized processes",
+        "Performance monitoring",
+        "Continuous improvement"
+    ],
+    "Workforce Development": [
+        "Staff competency",
+        "Training programs",
+        "Performance management"
+    ]
+})
+
+# QCI education domains and their items
+_EDUCATION_DOMAINS = _intern_domains({
+    "Leadership & Governance": [
+        "Institutional commitment",
+        "Policy development",
+        "Resource allocation"
+    ],
+    "Teaching & Learning": [
+        "Curriculum quality",
+        "Assessment practices",
+        "Student engagement"
+    ],
+    "Continuous Improvement": [
+        "Feedback mechanisms",
+        "Quality enhancement",
+        "Innovation culture"
+    ],
+    "Stakeholder Engagement": [
+        "Student involvement",
+        "Industry partnerships",
+        "Community engagement"
+    ]
+})
+
 class PharmaQualityCultureAssessment:
     """
     Pharmaceutical-specific quality culture assessment
     Implements PDA framework with FDA QMM compliance
     """
     
-    def __init__(self, config: PharmaAssessmentConfig = None):
+    # Maturity levels 1 to 5, one per 20-point band of the 0-100 score
+    _MATURITY_LEVELS: ClassVar[Tuple[str, ...]] = (
+        "Initial/Ad-hoc", "Developing", "Defined", "Managed", "Optimizing"
+    )
+    
+    # (domain, recommendation) pairs, recommended when the domain scores below 70
+    _RECOMMENDATIONS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("Leadership", "Enhance executive quality commitment through regular communication"),
+        ("Communication", "Implement structured quality communication channels"),
+        ("Ownership", "Develop quality accountability programs"),
+        ("Continuous Improvement", "Establish systematic improvement processes"),
+        ("Technical Excellence", "Invest in technical training and competency development")
+    )
+    
+    def __init__(self, config: PharmaAssessmentConfig = None, domains: Optional[Mapping[str, Tuple[str, ...]]] = None):
         self.config = config or PharmaAssessmentConfig()
-        self.domains = {
-            "Leadership": [
-                "Executive commitment to quality",
-                "Quality vision communication",
-                "Resource allocation for quality",
-                "Quality in strategic planning"
-            ],
-            "Communication": [
-                "Open communication channels",
-                "Quality message clarity",
-                "Cross-functional collaboration",
-                "Escalation processes"
-            ],
-            "Ownership": [
-                "Individual accountability",
-                "Team responsibility",
-                "Quality ownership culture",
-                "Proactive behavior"
-            ],
-            "Continuous Improvement": [
-                "Learning from mistakes",
-                "Process improvement initiatives",
-                "Innovation encouragement",
-                "Best practice sharing"
-            ],
-            "Technical Excellence": [
-                "Scientific rigor",
-                "Technical competency",
-                "Quality systems knowledge",
-                "Risk-based thinking"
-            ]
-        }
+        self.domains = domains if domains is not None else _PHARMA_DOMAINS
         
-        self.maturity_matrix = {
-            1: "Initial/Ad-hoc",
-            2: "Developing",
-            3: "Defined",
-            4: "Managed",
-            5: "Optimizing"
-        }
+        self.maturity_matrix = dict(enumerate(self._MATURITY_LEVELS, start=1))
     
-    def get_assessment_items(self) -> Dict[str, List[str]]:
+    def get_assessment_items(self) -> Mapping[str, Tuple[str, ...]]:
         """Get pharmaceutical-specific assessment items"""
         return self.domains
     
-    def calculate_maturity_score(self, responses: pd.DataFrame) -> Dict[str, float]:
+    def _scored_layout(self, responses: "pd.DataFrame"):
+        """
+        Domains scorable from responses (all their items present), with their items
+        laid out domain after domain so each domain is a contiguous column slice
+        
+        Returns:
+            (domain names, flat item list, start and stop offset of each domain)
+        """
+        scored = [(domain, items) for domain, items in self.domains.items()
+                  if all(item in responses.columns for item in items)]
+        all_items = [item for _, items in scored for item in items]
+        sizes = np.array([len(items) for _, items in scored], dtype=np.int64)
+        stops = np.cumsum(sizes)
+        return [domain for domain, _ in scored], all_items, stops - sizes, stops
+    
+    def calculate_maturity_score(self, responses: "pd.DataFrame") -> Dict[str, float]:
         """Calculate maturity scores for each domain"""
-        scores = {}
+        domains, all_items, starts, stops = self._scored_layout(responses)
+        if not domains:
+            return {}
+        
+        block = responses[all_items]
+        if all(isinstance(dtype, np.dtype) and dtype.kind in "biuf" for dtype in block.dtypes):
+            # Plain NumPy numeric columns: NaN is already NaN, skip the missing-value mask pass
+            X = block.to_numpy(dtype=np.float64)
+        else:
+            # Nullable, Arrow-backed or object columns: map pd.NA and None to NaN
+            X = block.to_numpy(dtype=np.float64, na_value=np.nan)
         
-        for domain, items in self.domains.items():
-            if all(item in responses.columns for item in items):
-                domain_scores = responses[items].mean()
-                scores[domain] = (domain_scores.mean() / 5.0) * 100
+        if _domain_means is not None:
+            domain_means = _domain_means(np.asfortranarray(X), starts, stops)
+        else:
+            # Every item mean in one NaN-skipping reduction, then one masked sum per domain slice
+            answered = (~np.isnan(X)).sum(axis=0)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                item_means = np.nansum(X, axis=0) / answered
+            domain_means = _slice_nanmeans(item_means, starts)
+        domain_scores = domain_means / 5.0 * 100
         
-        return scores
+        return dict(zip(domains, domain_scores.tolist()))
+    
+    def calculate_maturity_score_grouped(self, responses: "pd.DataFrame", site_col: str) -> "pd.DataFrame":
+        """
+        Calculate maturity scores for each domain, per site (or any other grouping column)
+        
+        Returns:
+            DataFrame with one row per site and one column per scored domain
+        """
+        import pandas as pd
+        
+        domains, all_items, starts, stops = self._scored_layout(responses)
+        if not domains:
+            return pd.DataFrame()
+        
+        # One groupby over integer category codes gives every site's item means
+        sites = responses[site_col].astype('category')
+        item_means = responses[all_items].groupby(sites, sort=False, observed=True).mean()
+        
+        X = item_means.to_numpy(dtype=np.float64, na_value=np.nan)
+        domain_means = _slice_nanmeans(X, starts, axis=1)
+        return pd.DataFrame(domain_means / 5.0 * 100, index=item_means.index, columns=domains)
     
     def generate_compliance_report(self, scores: Dict[str, float]) -> Dict[str, str]:
         """Generate FDA QMM compliance report"""
+        overall_maturity, critical_areas, recommendations = self._analyze(scores)
         report = {
-            "Overall Maturity": self._get_maturity_level(np.mean(list(scores.values()))),
-            "Critical Areas": self._identify_critical_areas(scores),
-            "Recommendations": self._generate_recommendations(scores),
+            "Overall Maturity": overall_maturity,
+            "Critical Areas": critical_areas,
+            "Recommendations": recommendations,
             "Next Steps": self._define_next_steps(scores)
         }
         
@@ -92,34 +268,25 @@ class PharmaQualityCultureAssessment:
     
     def _get_maturity_level(self, score: float) -> str:
         """Convert score to maturity level"""
-        level = max(1, min(5, int(np.ceil(score / 20))))
-        return self.maturity_matrix[level]
-    
-    def _identify_critical_areas(self, scores: Dict[str, float]) -> List[str]:
-        """Identify areas needing improvement"""
-        threshold = 60  # Below 60% is critical
-        return [domain for domain, score in scores.items() if score < threshold]
+        # Level = ceil(score / 20) clamped to 1-5, in integer arithmetic
+        level = -int(-score // 20)
+        return self._MATURITY_LEVELS[min(4, max(0, level - 1))]
     
-    def _generate_recommendations(self, scores: Dict[str, float]) -> List[str]:
-        """Generate specific recommendations"""
-        recommendations = []
+    def _analyze(self, scores: Dict[str, float]) -> Tuple[str, List[str], List[str]]:
+        """
+        Overall maturity level, critical areas (below 60) and recommendations (domains
+        below 70) from one array of the scores
+        """
+        domains = tuple(scores)
+        values = np.fromiter(scores.values(), dtype=np.float64, count=len(domains))
+        overall = float(values.mean()) if domains else 0.0
+        critical_areas = [domains[i] for i in np.flatnonzero(values < 60)]
         
-        if scores.get("Leadership", 0) < 70:
-            recommendations.append("Enhance executive quality commitment through regular communication")
+        # Recommendations follow the fixed domain table; unscored domains count as 0
+        recommendation_values = np.array([scores.get(domain, 0) for domain, _ in self._RECOMMENDATIONS], dtype=np.float64)
+        recommendations = [self._RECOMMENDATIONS[i][1] for i in np.flatnonzero(recommendation_values < 70)]
         
-        if scores.get("Communication", 0) < 70:
-            recommendations.append("Implement structured quality communication channels")
-        
-        if scores.get("Ownership", 0) < 70:
-            recommendations.append("Develop quality accountability programs")
-        
-        if scores.get("Continuous Improvement", 0) < 70:
-            recommendations.append("Establish systematic improvement processes")
-        
-        if scores.get("Technical Excellence", 0) < 70:
-            recommendations.append("Invest in technical training and competency development")
-        
-        return recommendations
+        return self._get_maturity_level(overall), critical_areas, recommendations
     
     def _define_next_steps(self, scores: Dict[str, float]) -> List[str]:
         """Define concrete next steps"""
@@ -135,57 +302,13 @@ class HealthcareAssessment(PharmaQualityCultureAssessment):
     """Healthcare-specific assessment based on NACCHO QI SAT 2.0"""
     
     def __init__(self):
-        super().__init__()
-        self.domains = {
-            "Leadership Commitment": [
-                "Executive leadership involvement",
-                "Quality as strategic priority",
-                "Resource allocation"
-            ],
-            "Customer Focus": [
-                "Patient-centered care",
-                "Community engagement",
-                "Service quality"
-            ],
-            "Process Management": [
-                "Standardized processes",
-                "Performance monitoring",
-                "Continuous improvement"
-            ],
-            "Workforce Development": [
-                "Staff competency",
-                "Training programs",
-                "Performance management"
-            ]
-        }
+        super().__init__(domains=_HEALTHCARE_DOMAINS)
 
 class EducationAssessment(PharmaQualityCultureAssessment):
     """Education sector assessment based on QCI framework"""
     
     def __init__(self):
-        super().__init__()
-        self.domains = {
-            "Leadership & Governance": [
-                "Institutional commitment",
-                "Policy development",
-                "Resource allocation"
-            ],
-            "Teaching & Learning": [
-                "Curriculum quality",
-                "Assessment practices",
-                "Student engagement"
-            ],
-            "Continuous Improvement": [
-                "Feedback mechanisms",
-                "Quality enhancement",
-                "Innovation culture"
-            ],
-            "Stakeholder Engagement": [
-                "Student involvement",
-                "Industry partnerships",
-                "Community engagement"
-            ]
-        }
+        super().__init__(domains=_EDUCATION_DOMAINS)
 
 # Example usage
 if __name__ == "__main__":
@@ -193,13 +316,11 @@ if __name__ == "__main__":
     pharma = PharmaQualityCultureAssessment()
     print("Pharmaceutical domains:", pharma.get_assessment_items())
     
-    # Generate demo data
-    demo_data = pd.DataFrame({
-        "Executive commitment to quality": np.random.uniform(3, 5, 100),
-        "Quality vision communication": np.random.uniform(3, 5, 100),
-        "Resource allocation for quality": np.random.uniform(3, 5, 100),
-        "Quality in strategic planning": np.random.uniform(3, 5, 100)
-    })
+    import pandas
+    
+    # Generate demo data: the four Leadership items, 100 respondents, one draw
+    rng = np.random.default_rng(0)
+    demo_data = pandas.DataFrame(rng.uniform(3, 5, size=(100, 4)), columns=list(_PHARMA_DOMAINS["Leadership"]))
     
     # Calculate scores
     scores = pharma.calculate_maturity_score(demo_data)
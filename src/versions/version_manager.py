@@ -3,79 +3,108 @@ Version Management System
 Handles Freemium vs Premium feature sets
 """
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, ClassVar, Dict, Mapping, Optional, Tuple
 from dataclasses import dataclass
-import pandas as pd
+from functools import cached_property
+from types import MappingProxyType
 
-@dataclass
+# pandas is only needed to build the comparison matrix and is imported there, so
+# modules that just look up versions or features do not load it
+if TYPE_CHECKING:
+    import pandas as pd
+
+@dataclass(frozen=True, slots=True)
 class VersionConfig:
     """Configuration for different versions"""
     name: str
     max_respondents: int
-    features: List[str]
+    features: Tuple[str, ...]
     price: str
     support_level: str
     data_retention_days: int
 
+# Version catalogue, built once at import and shared by every manager
+_VERSIONS = MappingProxyType({
+    "freemium": VersionConfig(
+        name="Freemium",
+        max_respondents=100,
+        features=(
+            "Basic assessment",
+            "Simple dashboard",
+            "PDF report",
+            "Email support",
+            "Basic analytics"
+        ),
+        price="Free",
+        support_level="Community",
+        data_retention_days=90
+    ),
+    "premium": VersionConfig(
+        name="Premium",
+        max_respondents=10000,
+        features=(
+            "Full assessment",
+            "Advanced dashboard",
+            "Custom reports",
+            "Priority support",
+            "Advanced analytics",
+            "Multi-site comparison",
+            "Benchmarking",
+            "API access",
+            "White-label options",
+            "Custom branding"
+        ),
+        price="Contact sales",
+        support_level="Dedicated",
+        data_retention_days=365
+    ),
+    "enterprise": VersionConfig(
+        name="Enterprise",
+        max_respondents=100000,
+        features=(
+            "Unlimited assessment",
+            "Custom framework",
+            "On-premise deployment",
+            "24/7 support",
+            "Advanced AI insights",
+            "Custom integrations",
+            "Dedicated account manager",
+            "Training programs",
+            "Compliance consulting"
+        ),
+        price="Custom pricing",
+        support_level="Enterprise",
+        data_retention_days=2555
+    )
+})
+
+# Feature membership as sets, for O(1) lookups
+_FEATURE_SETS = MappingProxyType({name: frozenset(config.features) for name, config in _VERSIONS.items()})
+
+# Feature comparison matrix, one row per version, computed once at import
+_COMPARED_FEATURES = (
+    "Basic assessment", "Advanced assessment", "Custom framework",
+    "Max respondents", "Multi-site", "Benchmarking", "API access",
+    "Custom reports", "White-label", "Priority support", "24/7 support"
+)
+_COMPARISON_COLUMNS = ("Feature",) + _COMPARED_FEATURES
+_COMPARISON_ROWS = tuple(
+    (version_name.capitalize(),) + tuple(
+        config.max_respondents if feature == "Max respondents"
+        else "✓" if feature in _FEATURE_SETS[version_name] else "✗"
+        for feature in _COMPARED_FEATURES
+    )
+    for version_name, config in _VERSIONS.items()
+)
+
 class VersionManager:
     """
     Manages different versions of the quality culture barometer
     """
     
     def __init__(self):
-        self.versions = {
-            "freemium": VersionConfig(
-                name="Freemium",
-                max_respondents=100,
-                features=[
-                    "Basic assessment",
-                    "Simple dashboard",
-                    "PDF report",
-                    "Email support",
-                    "Basic analytics"
-                ],
-                price="Free",
-                support_level="Community",
-                data_retention_days=90
-            ),
-            "premium": VersionConfig(
-                name="Premium",
-                max_respondents=10000,
-                features=[
-                    "Full assessment",
-                    "Advanced dashboard",
-                    "Custom reports",
-                    "Priority support",
-                    "Advanced analytics",
-                    "Multi-site comparison",
-                    "Benchmarking",
-                    "API access",
-                    "White-label options",
-                    "Custom branding"
-                ],
-                price="Contact sales",
-                support_level="Dedicated",
-                data_retention_days=365
-            ),
-            "enterprise": VersionConfig(
-                name="Enterprise",
-                max_respondents=100000,
-                features=[
-                    "Unlimited assessment",
-                    "Custom framework",
-                    "On-premise deployment",
-                    "24/7 support",
-                    "Advanced AI insights",
-                    "Custom integrations",
-                    "Dedicated account manager",
-                    "Training programs",
-                    "Compliance consulting"
-                ],
-                price="Custom pricing",
-                support_level="Enterprise",
-                data_retention_days=2555
-            )
-        }
+        self.versions = _VERSIONS
+        self._feature_sets = _FEATURE_SETS
     
     def get_version_config(self, version: str) -> VersionConfig:
         """Get configuration for specific version"""
@@ -83,8 +112,7 @@ class VersionManager:
     
     def check_feature_access(self, version: str, feature: str) -> bool:
         """Check if feature is available in version"""
-        config = self.get_version_config(version)
-        return feature in config.features
+        return feature in self._feature_sets.get(version.lower(), self._feature_sets["freemium"])
     
     def get_upgrade_path(self, current_version: str) -> Dict[str, str]:
         """Get upgrade recommendations"""
@@ -113,48 +141,37 @@ class VersionManager:
         
         return upgrade_paths.get(current_version, {})
     
-    def generate_feature_comparison(self) -> pd.DataFrame:
-        """Generate feature comparison matrix"""
-        features = [
-            "Basic assessment", "Advanced assessment", "Custom framework",
-            "Max respondents", "Multi-site", "Benchmarking", "API access",
-            "Custom reports", "White-label", "Priority support", "24/7 support"
-        ]
-        
-        comparison = []
-        for version_name, config in self.versions.items():
-            row = {"Feature": version_name.capitalize()}
-            
-            for feature in features:
-                if feature == "Max respondents":
-                    row[feature] = config.max_respondents
-                else:
-                    row[feature] = "✓" if feature in config.features else "✗"
-            
-            comparison.append(row)
+    @cached_property
+    def feature_comparison(self) -> "pd.DataFrame":
+        """Feature comparison matrix (built once per manager)"""
+        import pandas as pd
         
-        return pd.DataFrame(comparison)
+        return pd.DataFrame(_COMPARISON_ROWS, columns=_COMPARISON_COLUMNS)
+    
+    def generate_feature_comparison(self) -> "pd.DataFrame":
+        """Generate feature comparison matrix"""
+        # A copy, so callers can edit it without touching the cached matrix
+        return self.feature_comparison.copy()
 
 class FreemiumAssessment:
     """Freemium version implementation"""
     
-    def __init__(self):
-        self.max_respondents = 100
-        self.basic_items = [
-            "Quality is a top priority in our organization",
-            "I understand how my work impacts quality",
-            "Quality issues are addressed promptly",
-            "We continuously improve our processes",
-            "I feel empowered to report quality concerns"
-        ]
+    MAX_RESPONDENTS: ClassVar[int] = 100
+    BASIC_ITEMS: ClassVar[Tuple[str, ...]] = (
+        "Quality is a top priority in our organization",
+        "I understand how my work impacts quality",
+        "Quality issues are addressed promptly",
+        "We continuously improve our processes",
+        "I feel empowered to report quality concerns"
+    )
     
     def create_assessment(self, organization_name: str) -> Dict:
         """Create basic assessment"""
         return {
             "name": f"{organization_name} - Basic Assessment",
-            "items": self.basic_items,
+            "items": self.BASIC_ITEMS,
             "scale": "1-5 Likert",
-            "max_respondents": self.max_respondents,
+            "max_respondents": self.MAX_RESPONDENTS,
             "report_type": "PDF summary",
             "analytics": "Basic"
         }
@@ -162,42 +179,42 @@ class FreemiumAssessment:
 class PremiumAssessment:
     """Premium version implementation"""
     
-    def __init__(self):
-        self.max_respondents = 10000
-        self.advanced_items = {
-            "Leadership": [
-                "Executive team demonstrates visible commitment to quality",
-                "Quality objectives are clearly communicated",
-                "Resources are allocated to support quality initiatives",
-                "Quality performance is regularly reviewed"
-            ],
-            "Process": [
-                "Processes are standardized and documented",
-                "Quality controls are integrated into processes",
-                "Process performance is monitored",
-                "Improvements are systematically implemented"
-            ],
-            "People": [
-                "Employees are trained on quality requirements",
-                "Quality responsibilities are clearly defined",
-                "Employee feedback is encouraged",
-                "Recognition programs support quality"
-            ],
-            "Results": [
-                "Quality metrics are tracked and reported",
-                "Customer satisfaction is measured",
-                "Continuous improvement is demonstrated",
-                "Benchmarking is performed"
-            ]
-        }
+    MAX_RESPONDENTS: ClassVar[int] = 10000
+    ADVANCED_ITEMS: ClassVar[Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+        "Leadership": (
+            "Executive team demonstrates visible commitment to quality",
+            "Quality objectives are clearly communicated",
+            "Resources are allocated to support quality initiatives",
+            "Quality performance is regularly reviewed"
+        ),
+        "Process": (
+            "Processes are standardized and documented",
+            "Quality controls are integrated into processes",
+            "Process performance is monitored",
+            "Improvements are systematically implemented"
+        ),
+        "People": (
+            "Employees are trained on quality requirements",
+            "Quality responsibilities are clearly defined",
+            "Employee feedback is encouraged",
+            "Recognition programs support quality"
+        ),
+        "Results": (
+            "Quality metrics are tracked and reported",
+            "Customer satisfaction is measured",
+            "Continuous improvement is demonstrated",
+            "Benchmarking is performed"
+        )
+    })
     
     def create_assessment(self, organization_name: str) -> Dict:
         """Create advanced assessment"""
         return {
             "name": f"{organization_name} - Advanced Assessment",
-            "domains": self.advanced_items,
+            # Plain dict copy so the result stays JSON-serialisable
+            "domains": dict(self.ADVANCED_ITEMS),
             "scale": "1-7 Likert + open questions",
-            "max_respondents": self.max_respondents,
+            "max_respondents": self.MAX_RESPONDENTS,
             "report_type": "Interactive dashboard + PDF",
             "analytics": "Advanced with AI insights",
             "features": [
@@ -4,15 +4,15 @@ Ce fichier est le point d'entrée pour Streamlit Cloud
 """
 
 import streamlit as st
-import sys
-import os
 
-# Ajouter le chemin src au système
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+# Importer le dashboard principal (src est un package, importé depuis la racine du dépôt)
+from src.dashboard.quality_dashboard_fr import TableauBordCultureQualite
 
-# Importer le dashboard principal
-from dashboard.quality_dashboard_fr import TableauBordCultureQualite
+@st.cache_resource
+def _tableau_bord() -> TableauBordCultureQualite:
+    """Tableau de bord construit une seule fois et réutilisé à chaque réexécution (il est sans état)"""
+    return TableauBordCultureQualite()
 
 if __name__ == "__main__":
-    tableau_bord = TableauBordCultureQualite()
+    tableau_bord = _tableau_bord()
     tableau_bord.executer_tableau_bord()
\ No newline at end of file